@@ -13,6 +13,12 @@
 #define MAX_MOVES 256
 #define INVALID_INDEX 255
 #define TERMINAL_SCORE 1000000000.0
+#define KILLER_DEPTHS 64
+#define KILLER_SLOTS 2
+#define HISTORY_SIZE (CELL_COUNT * DIR_COUNT)
+
+/* History-table slot for a move: its trailing cell and direction. */
+#define HISTORY_INDEX(move) ((move)->trailing * DIR_COUNT + (move)->dir_idx)
 
 #define EMPTY 0
 #define BLACK 1
@@ -93,7 +99,8 @@ typedef struct {
     const TTTable *tt_seed;
     const uint64_t *shared_root_alpha_bits;
     double root_alpha_floor;
-    NativeMove killer_moves[64];
+    NativeMove killer_moves[KILLER_DEPTHS][KILLER_SLOTS];
+    uint64_t history[HISTORY_SIZE];
 } SearchContext;
 
 typedef struct {
@@ -125,6 +132,7 @@ int board_init(BoardState *board, const uint8_t *cells, int black_score, int whi
 void board_set_cell(BoardState *board, uint8_t idx, uint8_t color);
 int list_marbles(const BoardState *board, int player, uint8_t *marbles);
 int generate_legal_moves_native(const BoardState *board, int player, NativeMove *moves);
+int is_legal_move_native(const BoardState *board, const NativeMove *move, int player);
 double evaluate_weighted_native(const BoardState *board, int player, const double *weights);
 void order_moves(
     const BoardState *board,
@@ -132,7 +140,8 @@ void order_moves(
     NativeMove *moves,
     int count,
     const NativeMove *tt_move,
-    const NativeMove *killer_move
+    const NativeMove *killer_moves,
+    const uint64_t *history
 );
 void apply_move_native(BoardState *board, const NativeMove *move, int player);
 int search_weighted_native(
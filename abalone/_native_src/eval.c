@@ -180,40 +180,53 @@ evaluate_weighted_native(const BoardState *board, int player, const double *weig
     uint8_t opponent_marbles[14];
     int player_count = list_marbles(board, player, player_marbles);
     int opponent_count = list_marbles(board, opponent, opponent_marbles);
-    int player_adjacency;
-    int opponent_adjacency;
-    int player_cluster;
-    int opponent_cluster;
-    int player_stability;
-    int opponent_stability;
+    int player_adjacency = 0;
+    int opponent_adjacency = 0;
+    int player_cluster = 0;
+    int opponent_cluster = 0;
+    int player_stability = 0;
+    int opponent_stability = 0;
     int player_risk;
     int opponent_risk;
     int player_pressure;
     int opponent_pressure;
     double total = 0.0;
 
-    compute_structure_profile(board->bits[player], &player_adjacency, &player_cluster, &player_stability);
-    compute_structure_profile(board->bits[opponent], &opponent_adjacency, &opponent_cluster, &opponent_stability);
-    accumulate_edge_profile(player_marbles, player_count, &player_risk, &player_pressure);
-    accumulate_edge_profile(opponent_marbles, opponent_count, &opponent_risk, &opponent_pressure);
+    /* Zero-weight terms contribute exactly 0.0, so their scans are skipped. */
+    if (weights[2] != 0.0 || weights[3] != 0.0 || weights[8] != 0.0) {
+        compute_structure_profile(board->bits[player], &player_adjacency, &player_cluster, &player_stability);
+        compute_structure_profile(board->bits[opponent], &opponent_adjacency, &opponent_cluster, &opponent_stability);
+    }
 
     total += weights[0] * (double) (player_count - opponent_count);
-    total += weights[1] * (double) (
-        sum_squared_center_distance(opponent_marbles, opponent_count) -
-        sum_squared_center_distance(player_marbles, player_count)
-    );
+    if (weights[1] != 0.0) {
+        total += weights[1] * (double) (
+            sum_squared_center_distance(opponent_marbles, opponent_count) -
+            sum_squared_center_distance(player_marbles, player_count)
+        );
+    }
     total += weights[2] * (double) (player_adjacency - opponent_adjacency);
     total += weights[3] * (double) (player_cluster - opponent_cluster);
-    total += weights[4] * (double) ((opponent_risk + opponent_pressure) - (player_risk + player_pressure));
-    total += weights[5] * (double) (score_formations(board->bits[player]) - score_formations(board->bits[opponent]));
-    total += weights[6] * (double) (
-        score_push_pressure(board->bits[player], board->bits[opponent]) -
-        score_push_pressure(board->bits[opponent], board->bits[player])
-    );
-    total += weights[7] * (double) (
-        score_mobility(board->bits[player], board->bits[opponent]) -
-        score_mobility(board->bits[opponent], board->bits[player])
-    );
+    if (weights[4] != 0.0) {
+        accumulate_edge_profile(player_marbles, player_count, &player_risk, &player_pressure);
+        accumulate_edge_profile(opponent_marbles, opponent_count, &opponent_risk, &opponent_pressure);
+        total += weights[4] * (double) ((opponent_risk + opponent_pressure) - (player_risk + player_pressure));
+    }
+    if (weights[5] != 0.0) {
+        total += weights[5] * (double) (score_formations(board->bits[player]) - score_formations(board->bits[opponent]));
+    }
+    if (weights[6] != 0.0) {
+        total += weights[6] * (double) (
+            score_push_pressure(board->bits[player], board->bits[opponent]) -
+            score_push_pressure(board->bits[opponent], board->bits[player])
+        );
+    }
+    if (weights[7] != 0.0) {
+        total += weights[7] * (double) (
+            score_mobility(board->bits[player], board->bits[opponent]) -
+            score_mobility(board->bits[opponent], board->bits[player])
+        );
+    }
     total += weights[8] * (double) (player_stability - opponent_stability);
     return total;
 }
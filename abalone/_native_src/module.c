@@ -224,6 +224,44 @@ py_generate_legal_moves(PyObject *self, PyObject *args)
     return result;
 }
 
+/* Python wrapper for native full legality checks of one move payload. */
+static PyObject *
+py_is_legal_move(PyObject *self, PyObject *args)
+{
+    Py_buffer cells_buffer;
+    int player;
+    PyObject *move_obj;
+    BoardState board;
+    NativeMove move;
+
+    (void) self;
+    init_tables();
+
+    if (!PyArg_ParseTuple(args, "y*iO", &cells_buffer, &player, &move_obj)) {
+        return NULL;
+    }
+    if (cells_buffer.len != CELL_COUNT) {
+        PyBuffer_Release(&cells_buffer);
+        PyErr_Format(PyExc_ValueError, "cells payload must be %d bytes", CELL_COUNT);
+        return NULL;
+    }
+    if (!board_init(&board, (const uint8_t *) cells_buffer.buf, 0, 0)) {
+        PyBuffer_Release(&cells_buffer);
+        PyErr_SetString(PyExc_ValueError, "invalid board cells");
+        return NULL;
+    }
+    PyBuffer_Release(&cells_buffer);
+
+    if (move_obj == Py_None) {
+        PyErr_SetString(PyExc_TypeError, "move payload is required");
+        return NULL;
+    }
+    if (!parse_optional_move_payload(move_obj, &move)) {
+        return NULL;
+    }
+    return PyBool_FromLong(is_legal_move_native(&board, &move, player));
+}
+
 /* Python wrapper for native weighted board evaluation. */
 static PyObject *
 py_evaluate_weighted(PyObject *self, PyObject *args)
@@ -503,6 +541,7 @@ py_resolve_root_worker_count(PyObject *self, PyObject *args)
 
 static PyMethodDef module_methods[] = {
     {"generate_legal_moves", py_generate_legal_moves, METH_VARARGS, "Generate legal moves from a compact board payload."},
+    {"is_legal_move", py_is_legal_move, METH_VARARGS, "Fully validate one move payload against a compact board payload."},
     {"evaluate_weighted", py_evaluate_weighted, METH_VARARGS, "Evaluate a board using shared heuristic weights."},
     {"search_weighted", py_search_weighted, METH_VARARGS, "Run the native weighted minimax search."},
     {"_search_weighted_serial", py_search_weighted_serial, METH_VARARGS, "Internal serial native search hook for parity tests."},
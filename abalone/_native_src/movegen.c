@@ -81,33 +81,7 @@ is_generated_move_legal(const BoardState *board, const uint8_t *marbles, int cou
     return can_move_broadside(board, marbles, count, dir_idx);
 }
 
-/* Encodes a canonical move into a compact deduplication key. */
-static uint32_t
-encode_move_key(uint8_t dir_idx, const uint8_t *marbles, int count)
-{
-    uint32_t m0 = marbles[0];
-    uint32_t m1 = count > 1 ? marbles[1] : 61;
-    uint32_t m2 = count > 2 ? marbles[2] : 61;
-    return (uint32_t) dir_idx + 6U * (m0 + 62U * (m1 + 62U * (m2 + 62U * (uint32_t) (count - 1))));
-}
-
-/* Inserts a move key into the local open-addressed dedupe table. */
-static int
-insert_seen_key(uint32_t *keys, uint8_t *used, size_t capacity, uint32_t key)
-{
-    size_t idx = ((size_t) key * 2654435761U) & (capacity - 1);
-    while (used[idx]) {
-        if (keys[idx] == key) {
-            return 0;
-        }
-        idx = (idx + 1) & (capacity - 1);
-    }
-    used[idx] = 1;
-    keys[idx] = key;
-    return 1;
-}
-
-/* Canonicalizes, validates, and appends a generated move if it is new. */
+/* Canonicalizes, validates, and appends a generated move. */
 static int
 append_generated_move(
     const BoardState *board,
@@ -115,14 +89,11 @@ append_generated_move(
     const uint8_t *marbles,
     int count,
     uint8_t dir_idx,
-    uint32_t *seen_keys,
-    uint8_t *seen_used,
     NativeMove *moves,
     int *move_count
 )
 {
     uint8_t canonical[3] = {0, 0, 0};
-    uint32_t key;
     NativeMove move;
     int marble_idx;
 
@@ -130,10 +101,6 @@ append_generated_move(
         canonical[marble_idx] = marbles[marble_idx];
     }
     canonicalize_indices(canonical, count);
-    key = encode_move_key(dir_idx, canonical, count);
-    if (!insert_seen_key(seen_keys, seen_used, 512U, key)) {
-        return 0;
-    }
     if (!is_generated_move_legal(board, canonical, count, dir_idx, player)) {
         return 0;
     }
@@ -146,6 +113,33 @@ append_generated_move(
     return 0;
 }
 
+/* Fully validates an externally supplied canonical move: ownership, formation, then direction rules. */
+int
+is_legal_move_native(const BoardState *board, const NativeMove *move, int player)
+{
+    int idx;
+    for (idx = 0; idx < move->count; ++idx) {
+        if (board->cells[move->marbles[idx]] != (uint8_t) player) {
+            return 0;
+        }
+    }
+    if (move->count > 1) {
+        int line_dir = dir_index_from_delta(
+            (int) g_rows[move->marbles[1]] - (int) g_rows[move->marbles[0]],
+            (int) g_cols[move->marbles[1]] - (int) g_cols[move->marbles[0]]
+        );
+        if (line_dir < 0) {
+            return 0;
+        }
+        for (idx = 1; idx < move->count; ++idx) {
+            if (g_neighbors[move->marbles[idx - 1]][line_dir] != move->marbles[idx]) {
+                return 0;
+            }
+        }
+    }
+    return is_generated_move_legal(board, move->marbles, move->count, move->dir_idx, player);
+}
+
 /* Collects the current player's marble indices into a compact array. */
 int
 list_marbles(const BoardState *board, int player, uint8_t *marbles)
@@ -160,21 +154,23 @@ list_marbles(const BoardState *board, int player, uint8_t *marbles)
     return count;
 }
 
-/* Generates every legal move for the requested player without duplicates. */
+/*
+ * Generates every legal move for the requested player without duplicates.
+ *
+ * Each candidate is produced exactly once, so no dedupe table is needed: the
+ * first pass emits singles and inline groups (anchored at the trailing marble
+ * along the move direction), the second pass emits broadside groups anchored
+ * along a positive line direction and skips that line's two inline directions.
+ */
 int
 generate_legal_moves_native(const BoardState *board, int player, NativeMove *moves)
 {
     uint8_t marbles[14];
-    uint32_t seen_keys[512];
-    uint8_t seen_used[512];
     uint64_t player_bits = board->bits[player];
     int marble_count = list_marbles(board, player, marbles);
     int move_count = 0;
     int marble_list_index;
 
-    memset(seen_keys, 0, sizeof(seen_keys));
-    memset(seen_used, 0, sizeof(seen_used));
-
     for (marble_list_index = 0; marble_list_index < marble_count; ++marble_list_index) {
         uint8_t marble = marbles[marble_list_index];
         int ref_dir_index;
@@ -185,7 +181,7 @@ generate_legal_moves_native(const BoardState *board, int player, NativeMove *mov
             uint8_t third_marble;
 
             candidate[0] = marble;
-            if (append_generated_move(board, player, candidate, 1, dir_idx, seen_keys, seen_used, moves, &move_count) < 0) {
+            if (append_generated_move(board, player, candidate, 1, dir_idx, moves, &move_count) < 0) {
                 return -1;
             }
 
@@ -195,7 +191,7 @@ generate_legal_moves_native(const BoardState *board, int player, NativeMove *mov
             }
 
             candidate[1] = second_marble;
-            if (append_generated_move(board, player, candidate, 2, dir_idx, seen_keys, seen_used, moves, &move_count) < 0) {
+            if (append_generated_move(board, player, candidate, 2, dir_idx, moves, &move_count) < 0) {
                 return -1;
             }
 
@@ -205,7 +201,7 @@ generate_legal_moves_native(const BoardState *board, int player, NativeMove *mov
             }
 
             candidate[2] = third_marble;
-            if (append_generated_move(board, player, candidate, 3, dir_idx, seen_keys, seen_used, moves, &move_count) < 0) {
+            if (append_generated_move(board, player, candidate, 3, dir_idx, moves, &move_count) < 0) {
                 return -1;
             }
         }
@@ -216,6 +212,7 @@ generate_legal_moves_native(const BoardState *board, int player, NativeMove *mov
         int line_dir_idx;
         for (line_dir_idx = 0; line_dir_idx < 3; ++line_dir_idx) {
             uint8_t line_dir = POSITIVE_DIRS[line_dir_idx];
+            uint8_t back_dir = OPPOSITE_DIR[line_dir];
             uint8_t second = g_neighbors[marble][line_dir];
             int ref_dir_index;
 
@@ -226,7 +223,10 @@ generate_legal_moves_native(const BoardState *board, int player, NativeMove *mov
             for (ref_dir_index = 0; ref_dir_index < DIR_COUNT; ++ref_dir_index) {
                 uint8_t dir_idx = REFERENCE_DIRS[ref_dir_index];
                 uint8_t pair[2] = {marble, second};
-                if (append_generated_move(board, player, pair, 2, dir_idx, seen_keys, seen_used, moves, &move_count) < 0) {
+                if (dir_idx == line_dir || dir_idx == back_dir) {
+                    continue;
+                }
+                if (append_generated_move(board, player, pair, 2, dir_idx, moves, &move_count) < 0) {
                     return -1;
                 }
             }
@@ -239,7 +239,10 @@ generate_legal_moves_native(const BoardState *board, int player, NativeMove *mov
                 for (ref_dir_index = 0; ref_dir_index < DIR_COUNT; ++ref_dir_index) {
                     uint8_t dir_idx = REFERENCE_DIRS[ref_dir_index];
                     uint8_t triple[3] = {marble, second, third};
-                    if (append_generated_move(board, player, triple, 3, dir_idx, seen_keys, seen_used, moves, &move_count) < 0) {
+                    if (dir_idx == line_dir || dir_idx == back_dir) {
+                        continue;
+                    }
+                    if (append_generated_move(board, player, triple, 3, dir_idx, moves, &move_count) < 0) {
                         return -1;
                     }
                 }
@@ -250,20 +253,42 @@ generate_legal_moves_native(const BoardState *board, int player, NativeMove *mov
     return move_count;
 }
 
-/* Reports whether a move begins by pushing an opposing marble inline. */
+/* Mirrors Board.move_score: 1000 for a push-off, 100 for any other inline push, 0 for a quiet move. */
 static int
-is_push_move(const BoardState *board, int player, const NativeMove *move)
+move_score(const BoardState *board, int player, const NativeMove *move)
 {
-    int opponent = player == BLACK ? WHITE : BLACK;
+    uint8_t opponent = (uint8_t) (player == BLACK ? WHITE : BLACK);
     uint8_t ahead;
     if (!move->is_inline || move->count < 2) {
         return 0;
     }
     ahead = g_neighbors[move->leading][move->dir_idx];
-    return ahead != INVALID_INDEX && board->cells[ahead] == (uint8_t) opponent;
+    if (ahead == INVALID_INDEX || board->cells[ahead] != opponent) {
+        return 0;
+    }
+    while (ahead != INVALID_INDEX && board->cells[ahead] == opponent) {
+        ahead = g_neighbors[ahead][move->dir_idx];
+    }
+    return ahead == INVALID_INDEX ? 1000 : 100;
 }
 
-/* Compares two moves under TT, killer, push, and deterministic fallback priorities. */
+/* Returns the killer slot a move occupies, or KILLER_SLOTS when it is not a killer. */
+static int
+killer_rank(const NativeMove *move, const NativeMove *killer_moves)
+{
+    int slot;
+    if (killer_moves == NULL) {
+        return KILLER_SLOTS;
+    }
+    for (slot = 0; slot < KILLER_SLOTS; ++slot) {
+        if (move_has_value(&killer_moves[slot]) && move_equal(move, &killer_moves[slot])) {
+            return slot;
+        }
+    }
+    return KILLER_SLOTS;
+}
+
+/* Compares two moves under TT, killer, push-off/push, history, and deterministic fallback priorities. */
 static int
 compare_ordered_move(
     const BoardState *board,
@@ -271,7 +296,8 @@ compare_ordered_move(
     const NativeMove *left,
     const NativeMove *right,
     const NativeMove *tt_move,
-    const NativeMove *killer_move
+    const NativeMove *killer_moves,
+    const uint64_t *history
 )
 {
     int left_tt = move_has_value(tt_move) && move_equal(left, tt_move);
@@ -281,18 +307,26 @@ compare_ordered_move(
     }
 
     {
-        int left_killer = move_has_value(killer_move) && move_equal(left, killer_move);
-        int right_killer = move_has_value(killer_move) && move_equal(right, killer_move);
+        int left_killer = killer_rank(left, killer_moves);
+        int right_killer = killer_rank(right, killer_moves);
         if (left_killer != right_killer) {
-            return left_killer ? -1 : 1;
+            return left_killer < right_killer ? -1 : 1;
         }
     }
 
     {
-        int left_push = is_push_move(board, player, left);
-        int right_push = is_push_move(board, player, right);
-        if (left_push != right_push) {
-            return left_push ? -1 : 1;
+        int left_score = move_score(board, player, left);
+        int right_score = move_score(board, player, right);
+        if (left_score != right_score) {
+            return left_score > right_score ? -1 : 1;
+        }
+    }
+
+    if (history != NULL) {
+        uint64_t left_history = history[HISTORY_INDEX(left)];
+        uint64_t right_history = history[HISTORY_INDEX(right)];
+        if (left_history != right_history) {
+            return left_history > right_history ? -1 : 1;
         }
     }
 
@@ -303,7 +337,9 @@ compare_ordered_move(
     return compare_ordering_key_tail(left, right);
 }
 
-/* Sorts moves in place so alpha-beta sees the most promising ones first. */
+/* Sorts moves in place so alpha-beta sees the most promising ones first.
+ * `killer_moves` points at KILLER_SLOTS entries (newest first) or is NULL;
+ * `history` points at HISTORY_SIZE cutoff counters or is NULL. */
 void
 order_moves(
     const BoardState *board,
@@ -311,7 +347,8 @@ order_moves(
     NativeMove *moves,
     int count,
     const NativeMove *tt_move,
-    const NativeMove *killer_move
+    const NativeMove *killer_moves,
+    const uint64_t *history
 )
 {
     int move_index;
@@ -319,7 +356,7 @@ order_moves(
         NativeMove current_move = moves[move_index];
         int insert_pos = move_index - 1;
         while (insert_pos >= 0 &&
-                compare_ordered_move(board, player, &current_move, &moves[insert_pos], tt_move, killer_move) < 0) {
+                compare_ordered_move(board, player, &current_move, &moves[insert_pos], tt_move, killer_moves, history) < 0) {
             moves[insert_pos + 1] = moves[insert_pos];
             insert_pos -= 1;
         }
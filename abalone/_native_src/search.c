@@ -68,7 +68,8 @@ struct RootSearchThreadPool {
     int tie_break_lexicographic;
     const TTTable *tt_seed;
     TTTable tt_seed_snapshot;
-    const NativeMove *killer_moves_seed;
+    const NativeMove (*killer_moves_seed)[KILLER_SLOTS];
+    const uint64_t *history_seed;
     RootJobResult *results;
     int worker_count;
     RootSearchWorker *workers;
@@ -507,6 +508,28 @@ tt_store(TTTable *table, uint64_t key, int depth, double value, uint8_t flag, co
     return 1;
 }
 
+/* Remembers a cutoff move for `depth`, shifting the previous newest killer down a slot. */
+static void
+record_killer(SearchContext *ctx, int depth, const NativeMove *move)
+{
+    NativeMove *slots;
+    if (depth >= KILLER_DEPTHS) {
+        return;
+    }
+    slots = ctx->killer_moves[depth];
+    if (!move_equal(&slots[0], move)) {
+        slots[1] = slots[0];
+        slots[0] = *move;
+    }
+}
+
+/* Credits a cutoff move in the history table, weighting deeper cutoffs quadratically. */
+static void
+record_history(SearchContext *ctx, int depth, const NativeMove *move)
+{
+    ctx->history[HISTORY_INDEX(move)] += (uint64_t) depth * (uint64_t) depth;
+}
+
 /* Builds the transposition key for a board, side, search mode, and move budget. */
 static uint64_t
 tt_key_for_state(const BoardState *board, int to_move, int mode, int remaining_game_moves)
@@ -785,7 +808,7 @@ quiescence_native(
     }
 
     move_clear(&best_move);
-    order_moves(board, to_move, tactical_moves, tactical_count, &tt_move, &best_move);
+    order_moves(board, to_move, tactical_moves, tactical_count, &tt_move, NULL, NULL);
     opponent = to_move == BLACK ? WHITE : BLACK;
 
     for (move_index = 0; move_index < tactical_count; ++move_index) {
@@ -1001,7 +1024,8 @@ minimax_native(
         legal_moves,
         legal_count,
         &tt_move,
-        depth < (int) (sizeof(ctx->killer_moves) / sizeof(ctx->killer_moves[0])) ? &ctx->killer_moves[depth] : &tt_move
+        depth < KILLER_DEPTHS ? ctx->killer_moves[depth] : NULL,
+        ctx->history
     );
 
     maximizing = to_move == root_player;
@@ -1056,9 +1080,8 @@ minimax_native(
                 alpha = best_value;
             }
             if (beta <= alpha) {
-                if (depth < (int) (sizeof(ctx->killer_moves) / sizeof(ctx->killer_moves[0]))) {
-                    ctx->killer_moves[depth] = legal_moves[move_index];
-                }
+                record_killer(ctx, depth, &legal_moves[move_index]);
+                record_history(ctx, depth, &legal_moves[move_index]);
                 break;
             }
         } else {
@@ -1072,9 +1095,8 @@ minimax_native(
                 beta = best_value;
             }
             if (beta <= alpha) {
-                if (depth < (int) (sizeof(ctx->killer_moves) / sizeof(ctx->killer_moves[0]))) {
-                    ctx->killer_moves[depth] = legal_moves[move_index];
-                }
+                record_killer(ctx, depth, &legal_moves[move_index]);
+                record_history(ctx, depth, &legal_moves[move_index]);
                 break;
             }
         }
@@ -1184,6 +1206,9 @@ prepare_root_search_worker(RootSearchWorker *worker)
     if (pool->killer_moves_seed != NULL) {
         memcpy(worker->ctx.killer_moves, pool->killer_moves_seed, sizeof(worker->ctx.killer_moves));
     }
+    if (pool->history_seed != NULL) {
+        memcpy(worker->ctx.history, pool->history_seed, sizeof(worker->ctx.history));
+    }
     return tt_init(&worker->ctx.tt, 1024U);
 }
 
@@ -1298,7 +1323,8 @@ root_search_thread_pool_begin(
     const double *weights,
     int tie_break_lexicographic,
     const TTTable *tt_seed,
-    const NativeMove *killer_moves_seed,
+    const NativeMove (*killer_moves_seed)[KILLER_SLOTS],
+    const uint64_t *history_seed,
     RootJobResult *results
 )
 {
@@ -1321,6 +1347,7 @@ root_search_thread_pool_begin(
     pool->tie_break_lexicographic = tie_break_lexicographic;
     pool->tt_seed = &pool->tt_seed_snapshot;
     pool->killer_moves_seed = killer_moves_seed;
+    pool->history_seed = history_seed;
     pool->results = results;
     pool->next_job_index = start_index;
     pool->end_job_index = end_index;
@@ -1641,7 +1668,15 @@ search_weighted_native_serial(
         } else {
             move_clear(&tt_move);
         }
-        order_moves(board, player, ordered_root, legal_count, &tt_move, idx < (int) (sizeof(ctx.killer_moves) / sizeof(ctx.killer_moves[0])) ? &ctx.killer_moves[idx] : &tt_move);
+        order_moves(
+            board,
+            player,
+            ordered_root,
+            legal_count,
+            &tt_move,
+            idx < KILLER_DEPTHS ? ctx.killer_moves[idx] : NULL,
+            ctx.history
+        );
 
         for (move_index = 0; move_index < legal_count; ++move_index) {
             double child_value = 0.0;
@@ -1920,7 +1955,8 @@ search_weighted_native_threaded(
             ordered_root,
             legal_count,
             &tt_move,
-            idx < (int) (sizeof(ctx.killer_moves) / sizeof(ctx.killer_moves[0])) ? &ctx.killer_moves[idx] : &tt_move
+            idx < KILLER_DEPTHS ? ctx.killer_moves[idx] : NULL,
+            ctx.history
         );
 
         {
@@ -2032,6 +2068,7 @@ search_weighted_native_threaded(
                         tie_break_lexicographic,
                         &ctx.tt,
                         ctx.killer_moves,
+                        ctx.history,
                         worker_results)) {
                     tt_free(&ctx.tt);
                     root_search_thread_pool_destroy(&pool);
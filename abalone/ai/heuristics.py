@@ -3,7 +3,7 @@
 from collections import deque
 from typing import Callable, Dict, List, Set, Tuple
 
-from ..game.board import BLACK, WHITE, Board, DIRECTIONS, VALID_POSITIONS, is_valid, Position
+from ..game.board import Board, DIRECTIONS, NEIGHBOR_TABLE, OPPONENT, VALID_POSITIONS, Position
 
 CENTER = (4, 5)
 
@@ -49,20 +49,26 @@ def _get_native_evaluate_weighted():
 
 
 def _opponent(player: int) -> int:
-    return WHITE if player == BLACK else BLACK
+    return OPPONENT[player]
+
+
+def _center_distance_sq(pos: Position) -> int:
+    """Return squared hex distance from `pos` to the board center."""
+    dr, dc = pos[0] - CENTER[0], pos[1] - CENTER[1]
+    if (dr >= 0 and dc >= 0) or (dr <= 0 and dc <= 0):
+        dist = max(abs(dr), abs(dc))
+    else:
+        dist = abs(dr) + abs(dc)
+    return dist ** 2
+
+
+# Squared center distance per playable cell, looked up instead of recomputed per evaluation.
+CENTER_DISTANCE_SQ = {pos: _center_distance_sq(pos) for pos in VALID_POSITIONS}
 
 
 def _center_distance_sum(marbles: List[Position]) -> int:
     """Return total squared distance from center using the board's hex geometry."""
-    total = 0
-    for r, c in marbles:
-        dr, dc = r - CENTER[0], c - CENTER[1]
-        if (dr >= 0 and dc >= 0) or (dr <= 0 and dc <= 0):
-            dist = max(abs(dr), abs(dc))
-        else:
-            dist = abs(dr) + abs(dc)
-        total += dist ** 2
-    return total
+    return sum(map(CENTER_DISTANCE_SQ.__getitem__, marbles))
 
 
 def _structure_profile(marbles: Set[Position]) -> Tuple[int, int, int]:
@@ -281,22 +287,31 @@ def largest_cluster(player_marbles: Set[Position], opp_marbles: Set[Position]) -
     return float(cluster_size(player_marbles) - cluster_size(opp_marbles))
 
 
+def _build_edge_distance_table() -> Dict[Position, int]:
+    """Precompute each cell's distance to the rim, capped at 2."""
+    table = {}
+    for pos in VALID_POSITIONS:
+        edge_dist = 2
+        for direction_index, pos1 in enumerate(NEIGHBOR_TABLE[pos]):
+            if pos1 is None:
+                edge_dist = 0
+                break
+            if NEIGHBOR_TABLE[pos1][direction_index] is None:
+                edge_dist = 1
+        table[pos] = edge_dist
+    return table
+
+
+_EDGE_DISTANCE: Dict[Position, int] = _build_edge_distance_table()
+
+
 def _edge_profile(marbles: List[Position]) -> Tuple[int, int]:
     """Return combined edge-risk and rim-pressure points from one pass."""
     risk_points = 0
     pressure_points = 0
 
-    for r, c in marbles:
-        edge_dist = 2
-        for dr, dc in DIRECTIONS:
-            pos1 = (r + dr, c + dc)
-            if not is_valid(pos1):
-                edge_dist = 0
-                break
-            pos2 = (pos1[0] + dr, pos1[1] + dc)
-            if not is_valid(pos2):
-                edge_dist = min(edge_dist, 1)
-
+    for pos in marbles:
+        edge_dist = _EDGE_DISTANCE[pos]
         if edge_dist == 0:
             risk_points += 2
             pressure_points += 1
@@ -400,18 +415,23 @@ def evaluate_with_weights(board: Board, player: int, weights: Dict[str, float])
 def build_weighted_evaluator(weights: Dict[str, float]) -> Callable[[Board, int], float]:
     """Create an evaluator callable from a shared weight dictionary."""
     resolved = normalize_weights(weights, fill_missing=True)
+    # Weights are fixed for the evaluator's lifetime, so validate and order them once.
+    ordered_weights = tuple(resolved[key] for key in FEATURE_ORDER)
 
     def evaluator(board: Board, player: int) -> float:
-        return evaluate_with_weights(board, player, resolved)
+        return _get_native_evaluate_weighted()(board, player, ordered_weights)
 
     # Attach weights for reporting/inspection (e.g., benchmarking summaries).
     evaluator.weights = dict(resolved)
     return evaluator
 
 
+_DEFAULT_ORDERED_WEIGHTS = tuple(DEFAULT_WEIGHTS[key] for key in FEATURE_ORDER)
+
+
 def evaluate_board(board: Board, player: int) -> float:
     """Default balanced heuristic evaluation."""
-    return evaluate_with_weights(board, player, DEFAULT_WEIGHTS)
+    return _get_native_evaluate_weighted()(board, player, _DEFAULT_ORDERED_WEIGHTS)
 
 
 # Attach baseline weights for reporting/inspection.
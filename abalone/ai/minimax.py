@@ -5,7 +5,7 @@ from math import inf
 import time
 from typing import Dict, List, Optional, Tuple
 
-from ..game.board import BLACK, WHITE, Board, DIRECTION_INDEX, Move, NEIGHBOR_TABLE, ZOBRIST
+from ..game.board import BLACK, CELL_COUNT, DIRECTIONS, WHITE, Board, Move, OPPONENT, ZOBRIST_SIDE
 from ..native import search_weighted as native_search_weighted
 from ..state_space import generate_legal_moves
 from .defaults import DEFAULT_AGENT
@@ -22,11 +22,18 @@ UPPERBOUND = 2
 TT_MODE_FULL = 0
 TT_MODE_QUIESCENCE = 1
 
+# Killer moves remembered per remaining depth, newest first.
+KILLER_SLOTS = 2
+_NO_KILLERS: Tuple[None, ...] = (None,) * KILLER_SLOTS
+
+# History-heuristic cutoff credit per (trailing cell, direction), kept for one whole search.
+HISTORY_SIZE = CELL_COUNT * len(DIRECTIONS)
+
 _FORCE_WEIGHTED_SEARCH_PATH: Optional[str] = None
 TERMINAL_SCORE = 1_000_000_000.0
 
 
-@dataclass
+@dataclass(slots=True)
 class TTEntry:
     """Entry stored in the transposition table."""
 
@@ -36,7 +43,7 @@ class TTEntry:
     move: Optional[Move]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SearchResult:
     """Search output including chosen move and diagnostic metadata."""
 
@@ -129,7 +136,7 @@ def _normalize_root_candidates(raw_candidates, limit: int):
 
 def _opponent(player: int) -> int:
     """Return the opposing color constant."""
-    return WHITE if player == BLACK else BLACK
+    return OPPONENT[player]
 
 
 def _is_terminal(board: Board) -> bool:
@@ -155,12 +162,7 @@ def _terminal_value(board: Board, root_player: int, depth_remaining: int) -> Opt
 
 def _is_push_move(board: Board, player: int, move: Move) -> bool:
     """Heuristic check used for move ordering: whether move contacts an opponent inline."""
-    if not move.is_inline or move.count < 2:
-        return False
-
-    ahead = NEIGHBOR_TABLE[move._leading][DIRECTION_INDEX[move.direction]]
-    opponent = _opponent(player)
-    return ahead is not None and board.cells[ahead] == opponent
+    return board.would_push(move, player)
 
 
 def _is_quiescence_move(board: Board, player: int, move: Move) -> bool:
@@ -182,7 +184,11 @@ def _quiescence(
     stats: Dict[str, int],
     tt: Dict[tuple[int, int, int], TTEntry],
 ) -> tuple[float, Optional[Move]]:
-    """Extend only tactical leaf moves to reduce horizon effects in noisy positions."""
+    """Extend only tactical leaf moves to reduce horizon effects in noisy positions.
+
+    Negamax form: `alpha`, `beta`, and the returned value are from `to_move`'s
+    point of view; `root_player`'s evaluator output is sign-flipped to match.
+    """
     _check_deadline(deadline_at)
     stats["nodes"] += 1
     alpha_orig = alpha
@@ -201,30 +207,24 @@ def _quiescence(
             return tt_entry.value, tt_entry.move
 
     tt_move = tt_entry.move if tt_entry is not None else None
+    sign = 1 if to_move == root_player else -1
 
     terminal_value = _terminal_value(board, root_player, remaining_depth)
     if terminal_value is not None:
+        terminal_value *= sign
         tt[tt_key] = TTEntry(depth=remaining_depth, value=terminal_value, flag=EXACT, move=None)
         return terminal_value, None
 
-    stand_pat = evaluator(board, root_player)
+    stand_pat = sign * evaluator(board, root_player)
     if remaining_depth <= 0 or (remaining_game_moves is not None and remaining_game_moves <= 0):
         tt[tt_key] = TTEntry(depth=remaining_depth, value=stand_pat, flag=EXACT, move=None)
         return stand_pat, None
 
-    maximizing = to_move == root_player
-    if maximizing:
-        if stand_pat >= beta:
-            tt[tt_key] = TTEntry(depth=remaining_depth, value=stand_pat, flag=LOWERBOUND, move=None)
-            return stand_pat, None
-        alpha = max(alpha, stand_pat)
-        best_value = stand_pat
-    else:
-        if stand_pat <= alpha:
-            tt[tt_key] = TTEntry(depth=remaining_depth, value=stand_pat, flag=UPPERBOUND, move=None)
-            return stand_pat, None
-        beta = min(beta, stand_pat)
-        best_value = stand_pat
+    if stand_pat >= beta:
+        tt[tt_key] = TTEntry(depth=remaining_depth, value=stand_pat, flag=LOWERBOUND, move=None)
+        return stand_pat, None
+    alpha = max(alpha, stand_pat)
+    best_value = stand_pat
 
     tactical_moves = [
         move
@@ -240,62 +240,34 @@ def _quiescence(
     opponent = _opponent(to_move)
     next_remaining_game_moves = None if remaining_game_moves is None else remaining_game_moves - 1
 
-    if maximizing:
-        for move in tactical_moves:
-            _check_deadline(deadline_at)
-            undo_info = board.apply_move_undo(move, to_move)
-            try:
-                value, _ = _quiescence(
-                    board,
-                    opponent,
-                    root_player,
-                    remaining_depth - 1,
-                    next_remaining_game_moves,
-                    alpha,
-                    beta,
-                    evaluator,
-                    tie_break,
-                    deadline_at,
-                    stats,
-                    tt,
-                )
-            finally:
-                board.undo_move(undo_info)
-
-            if value > best_value or (value == best_value and _prefer_by_tie_break(tie_break, move, best_move)):
-                best_value = value
-                best_move = move
-            alpha = max(alpha, best_value)
-            if beta <= alpha:
-                break
-    else:
-        for move in tactical_moves:
-            _check_deadline(deadline_at)
-            undo_info = board.apply_move_undo(move, to_move)
-            try:
-                value, _ = _quiescence(
-                    board,
-                    opponent,
-                    root_player,
-                    remaining_depth - 1,
-                    next_remaining_game_moves,
-                    alpha,
-                    beta,
-                    evaluator,
-                    tie_break,
-                    deadline_at,
-                    stats,
-                    tt,
-                )
-            finally:
-                board.undo_move(undo_info)
-
-            if value < best_value or (value == best_value and _prefer_by_tie_break(tie_break, move, best_move)):
-                best_value = value
-                best_move = move
-            beta = min(beta, best_value)
-            if beta <= alpha:
-                break
+    for move in tactical_moves:
+        _check_deadline(deadline_at)
+        undo_info = board.apply_move_undo(move, to_move)
+        try:
+            value, _ = _quiescence(
+                board,
+                opponent,
+                root_player,
+                remaining_depth - 1,
+                next_remaining_game_moves,
+                -beta,
+                -alpha,
+                evaluator,
+                tie_break,
+                deadline_at,
+                stats,
+                tt,
+            )
+        finally:
+            board.undo_move(undo_info)
+
+        value = -value
+        if value > best_value or (value == best_value and _prefer_by_tie_break(tie_break, move, best_move)):
+            best_value = value
+            best_move = move
+        alpha = max(alpha, best_value)
+        if beta <= alpha:
+            break
 
     if best_value <= alpha_orig:
         flag = UPPERBOUND
@@ -313,20 +285,22 @@ def _ordered_moves(
     player: int,
     moves: List[Move],
     tt_move: Optional[Move] = None,
-    killer_moves: Optional[List[Optional[Move]]] = None,
+    killer_moves: Optional[List[List[Optional[Move]]]] = None,
     depth: int = 0,
+    history: Optional[List[int]] = None,
 ) -> List[Move]:
     """Order moves to improve alpha-beta pruning deterministically.
 
-    Priority: TT move > killer moves > push moves > multi-marble > notation.
+    Priority: TT move > newest killer > older killer > push-offs > pushes > history > multi-marble > notation.
     """
-    killer1 = killer_moves[depth] if killer_moves and depth < len(killer_moves) else None
+    killers = killer_moves[depth] if killer_moves and depth < len(killer_moves) else _NO_KILLERS
 
-    def key(move: Move) -> Tuple[int, int, int, int, tuple]:
+    def key(move: Move) -> Tuple[int, int, int, int, int, tuple]:
         return (
             0 if move == tt_move else 1,
-            0 if move == killer1 else 1,
-            0 if _is_push_move(board, player, move) else 1,
+            killers.index(move) if move in killers else KILLER_SLOTS,
+            -board.move_score(move, player),
+            -history[_history_index(move)] if history is not None else 0,
             -move.count,
             move.ordering_key,
         )
@@ -334,6 +308,26 @@ def _ordered_moves(
     return sorted(moves, key=key)
 
 
+def _record_killer(killer_moves: List[List[Optional[Move]]], depth: int, move: Move) -> None:
+    """Remember a cutoff move for `depth`, shifting the previous newest killer down a slot."""
+    if depth >= len(killer_moves):
+        return
+    slots = killer_moves[depth]
+    if slots[0] != move:
+        slots[1] = slots[0]
+        slots[0] = move
+
+
+def _history_index(move: Move) -> int:
+    """Return the history-table slot for a move's trailing cell and direction."""
+    return move.trailing_id * len(DIRECTIONS) + move.direction_index
+
+
+def _record_history(history: List[int], depth: int, move: Move) -> None:
+    """Credit a cutoff move, weighting deeper cutoffs quadratically."""
+    history[_history_index(move)] += depth * depth
+
+
 def _prefer_by_tie_break(tie_break: str, candidate: Move, incumbent: Optional[Move]) -> bool:
     """Resolve equal-valued moves using the configured deterministic tie-break."""
     if incumbent is None:
@@ -357,12 +351,14 @@ def _immediate_terminal_root_result(
     start = time.perf_counter()
     winning_moves: List[Move] = []
     for move in generate_legal_moves(board, player):
-        child = board.copy()
-        child.apply_move(move, player)
-        if _terminal_value(child, player, 0) is not None and (
-            child.score[player] >= 6 or child.marble_count(opponent) <= 8
-        ):
-            winning_moves.append(move)
+        undo_info = board.apply_move_undo(move, player)
+        try:
+            if _terminal_value(board, player, 0) is not None and (
+                board.score[player] >= 6 or board.marble_count(opponent) <= 8
+            ):
+                winning_moves.append(move)
+        finally:
+            board.undo_move(undo_info)
 
     if not winning_moves:
         return None
@@ -417,7 +413,7 @@ def _make_tt_key(
 ) -> tuple[int, int, int]:
     """Create a TT key from the board hash, side to move, search mode, and move budget."""
     remaining_key = -1 if remaining_game_moves is None else int(remaining_game_moves)
-    return board.zhash ^ ZOBRIST[('side', to_move)], mode, remaining_key
+    return board.zhash ^ ZOBRIST_SIDE[to_move], mode, remaining_key
 
 
 def _minimax(
@@ -433,14 +429,19 @@ def _minimax(
     deadline_at: Optional[float],
     stats: Dict[str, int],
     tt: Dict[tuple[int, int, int], TTEntry],
-    killer_moves: List[Optional[Move]],
+    killer_moves: List[List[Optional[Move]]],
+    history: List[int],
     max_quiescence_depth: int,
     root_legal_moves: Optional[List[Move]] = None,
 ) -> tuple[float, Optional[Move]]:
-    """Run depth-limited minimax with alpha-beta pruning, TT, killer moves, and undo/redo."""
+    """Run depth-limited negamax with alpha-beta pruning, TT, killer/history ordering, and undo/redo.
+
+    `alpha`, `beta`, and the returned value are from `to_move`'s point of view.
+    """
     _check_deadline(deadline_at)
+    sign = 1 if to_move == root_player else -1
     if remaining_game_moves is not None and remaining_game_moves <= 0:
-        return evaluator(board, root_player), None
+        return sign * evaluator(board, root_player), None
     if depth == 0 and not _is_terminal(board) and max_quiescence_depth > 0:
         return _quiescence(
             board,
@@ -479,10 +480,10 @@ def _minimax(
 
     terminal_value = _terminal_value(board, root_player, depth)
     if terminal_value is not None:
-        return terminal_value, None
+        return sign * terminal_value, None
 
     if depth == 0:
-        return evaluator(board, root_player), None
+        return sign * evaluator(board, root_player), None
 
     if root_legal_moves is not None:
         legal_moves = root_legal_moves
@@ -492,82 +493,48 @@ def _minimax(
     if not legal_moves:
         terminal_value = _terminal_value(board, root_player, depth)
         if terminal_value is not None:
-            return terminal_value, None
-        return evaluator(board, root_player), None
+            return sign * terminal_value, None
+        return sign * evaluator(board, root_player), None
 
-    legal_moves = _ordered_moves(board, to_move, legal_moves, tt_move, killer_moves, depth)
-    maximizing = to_move == root_player
+    legal_moves = _ordered_moves(board, to_move, legal_moves, tt_move, killer_moves, depth, history)
     opponent = _opponent(to_move)
     best_move = None
     next_remaining_game_moves = None if remaining_game_moves is None else remaining_game_moves - 1
 
-    if maximizing:
-        best_value = -inf
-        for move in legal_moves:
-            _check_deadline(deadline_at)
-            undo_info = board.apply_move_undo(move, to_move)
-            try:
-                value, _ = _minimax(
-                    board,
-                    opponent,
-                    root_player,
-                    depth - 1,
-                    next_remaining_game_moves,
-                    alpha,
-                    beta,
-                    evaluator,
-                    tie_break,
-                    deadline_at,
-                    stats,
-                    tt,
-                    killer_moves,
-                    max_quiescence_depth,
-                )
-            finally:
-                board.undo_move(undo_info)
-
-            if value > best_value or (value == best_value and _prefer_by_tie_break(tie_break, move, best_move)):
-                best_value = value
-                best_move = move
-            alpha = max(alpha, best_value)
-            if beta <= alpha:
-                # Record killer move on cutoff
-                if depth < len(killer_moves):
-                    killer_moves[depth] = move
-                break
-    else:
-        best_value = inf
-        for move in legal_moves:
-            _check_deadline(deadline_at)
-            undo_info = board.apply_move_undo(move, to_move)
-            try:
-                value, _ = _minimax(
-                    board,
-                    opponent,
-                    root_player,
-                    depth - 1,
-                    next_remaining_game_moves,
-                    alpha,
-                    beta,
-                    evaluator,
-                    tie_break,
-                    deadline_at,
-                    stats,
-                    tt,
-                    killer_moves,
-                    max_quiescence_depth,
-                )
-            finally:
-                board.undo_move(undo_info)
-
-            if value < best_value or (value == best_value and _prefer_by_tie_break(tie_break, move, best_move)):
-                best_value = value
-                best_move = move
-            beta = min(beta, best_value)
-            if beta <= alpha:
-                if depth < len(killer_moves):
-                    killer_moves[depth] = move
-                break
+    best_value = -inf
+    for move in legal_moves:
+        _check_deadline(deadline_at)
+        undo_info = board.apply_move_undo(move, to_move)
+        try:
+            value, _ = _minimax(
+                board,
+                opponent,
+                root_player,
+                depth - 1,
+                next_remaining_game_moves,
+                -beta,
+                -alpha,
+                evaluator,
+                tie_break,
+                deadline_at,
+                stats,
+                tt,
+                killer_moves,
+                history,
+                max_quiescence_depth,
+            )
+        finally:
+            board.undo_move(undo_info)
+
+        value = -value
+        if value > best_value or (value == best_value and _prefer_by_tie_break(tie_break, move, best_move)):
+            best_value = value
+            best_move = move
+        alpha = max(alpha, best_value)
+        if beta <= alpha:
+            _record_killer(killer_moves, depth, move)
+            _record_history(history, depth, move)
+            break
 
     if best_value <= alpha_orig:
         flag = UPPERBOUND
@@ -722,14 +689,15 @@ def _search_best_move_python(
     root_candidates: List[Dict[str, object]] = []
 
     tt: Dict[tuple[int, int, int], TTEntry] = {}
-    killer_moves: List[Optional[Move]] = [None] * (requested_depth + 1)
+    killer_moves: List[List[Optional[Move]]] = [[None] * KILLER_SLOTS for _ in range(requested_depth + 1)]
+    history = [0] * HISTORY_SIZE
     opponent = _opponent(player)
     child_remaining_game_moves = None if remaining_game_moves is None else max(0, remaining_game_moves - 1)
 
     for depth in range(1, requested_depth + 1):
         stats = {"nodes": 0}
-        for i in range(len(killer_moves)):
-            killer_moves[i] = None
+        for slots in killer_moves:
+            slots[:] = _NO_KILLERS
 
         alpha = -inf
         beta = inf
@@ -741,7 +709,7 @@ def _search_best_move_python(
             tt_key = _make_tt_key(board, player, TT_MODE_FULL, remaining_game_moves)
             tt_entry = tt.get(tt_key)
             tt_move = tt_entry.move if tt_entry is not None else None
-            ordered_moves = _ordered_moves(board, player, legal_moves, tt_move, killer_moves, depth)
+            ordered_moves = _ordered_moves(board, player, legal_moves, tt_move, killer_moves, depth, history)
 
             for move in ordered_moves:
                 _check_deadline(deadline_at)
@@ -754,19 +722,22 @@ def _search_best_move_python(
                         player,
                         depth - 1,
                         child_remaining_game_moves,
-                        alpha,
-                        beta,
+                        -beta,
+                        -alpha,
                         resolved_agent.evaluator,
                         resolved_config.tie_break,
                         deadline_at,
                         stats,
                         tt,
                         killer_moves,
+                        history,
                         resolved_config.max_quiescence_depth,
                     )
                 finally:
                     board.undo_move(undo_info)
 
+                value = -value
+
                 if value > current_best_score or (
                     value == current_best_score
                     and _prefer_by_tie_break(resolved_config.tie_break, move, current_best_move)
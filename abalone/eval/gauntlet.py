@@ -22,7 +22,7 @@ from ..ai.heuristics import (
 )
 from ..ai.agent import choose_move_with_info
 from ..ai.types import AgentConfig
-from ..game.board import BLACK, WHITE, Board
+from ..game.board import BLACK, WHITE, OPPONENT, Board
 from ..game.config import GameConfig
 from ..game.session import GameSession
 from ..players.registry import build_runtime_agent, get_agent_weights, list_agents
@@ -311,7 +311,7 @@ def run_scheduled_game(
         "winner_tiebreak": status.get("winner_tiebreak"),
         "game_over_reason": status.get("game_over_reason"),
         "time_used_ms": status.get("time_used_ms", {BLACK: 0, WHITE: 0}),
-        "score": dict(session.board.score),
+        "score": session.board.score_by_player(),
         "moves": len(session.move_history),
         "duration_s": elapsed_s,
         "agent_color": job.get("agent_color"),
@@ -583,7 +583,7 @@ def analyze_match_result(
 ) -> dict:
     """Analyze one game using phase-aware critical turns and offline teacher reruns."""
     target_color = _target_color(game, target_agent_id)
-    opponent_color = WHITE if target_color == BLACK else BLACK
+    opponent_color = OPPONENT[target_color]
     opponent_id = _opponent_for_game(game, target_agent_id)
     outcome = _outcome_for_game(game, target_agent_id)
     target_score = int(game["score"][target_color])
@@ -19,6 +19,7 @@ Board layout:
 """
 
 import random as _random
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Set, Tuple
 
@@ -30,18 +31,19 @@ Direction = Tuple[int, int]
 BLACK = 1
 WHITE = 2
 EMPTY = 0
+OPPONENT: Tuple[int, int, int] = (EMPTY, WHITE, BLACK)  # indexed by color
 
 ROW_LETTERS = 'abcdefghi'
 
 # 6 hex directions as (row_delta, col_delta)
-DIRECTIONS: List[Direction] = [
+DIRECTIONS: Tuple[Direction, ...] = (
     (0, 1),    # E  (right)
     (0, -1),   # W  (left)
     (1, 0),    # NW (up-left: row increases, same col)
     (-1, 0),   # SE (down-right: row decreases, same col)
     (1, 1),    # NE (up-right)
     (-1, -1),  # SW (down-left)
-]
+)
 DIRECTION_SET = frozenset(DIRECTIONS)
 
 DIRECTION_NAMES: Dict[Direction, str] = {
@@ -52,17 +54,20 @@ DIRECTION_NAMES: Dict[Direction, str] = {
 
 NAME_TO_DIR: Dict[str, Direction] = {v: k for k, v in DIRECTION_NAMES.items()}
 DIRECTION_INDEX: Dict[Direction, int] = {direction: index for index, direction in enumerate(DIRECTIONS)}
+DIRECTION_NAME_BY_INDEX: Tuple[str, ...] = tuple(DIRECTION_NAMES[d] for d in DIRECTIONS)
+# Direction index keyed by `dr * 16 + dc`, so line detection needs no tuple allocation.
+_DIRECTION_CODE_INDEX: Dict[int, int] = {dr * 16 + dc: index for index, (dr, dc) in enumerate(DIRECTIONS)}
 OPPOSITE_DIRECTION: Dict[Direction, Direction] = {
     direction: (-direction[0], -direction[1])
     for direction in DIRECTIONS
 }
 
 # 3 axes (pairs of opposite directions)
-AXES = [
+AXES: Tuple[Tuple[Direction, Direction], ...] = (
     ((0, 1), (0, -1)),    # E-W
     ((1, 0), (-1, 0)),    # NW-SE
     ((1, 1), (-1, -1)),   # NE-SW
-]
+)
 
 
 def _build_valid_positions() -> Set[Position]:
@@ -101,6 +106,48 @@ def _build_neighbor_table() -> Dict[Position, Tuple[Optional[Position], ...]]:
 
 NEIGHBOR_TABLE: Dict[Position, Tuple[Optional[Position], ...]] = _build_neighbor_table()
 
+CELL_COUNT = len(ORDERED_VALID_POSITIONS)
+OFF_BOARD = -1
+
+
+def _build_neighbor_index_table() -> Tuple[Tuple[int, ...], ...]:
+    """Precompute neighbor cell ids per cell id and direction, using `OFF_BOARD` past the rim."""
+    return tuple(
+        tuple(OFF_BOARD if ahead is None else POSITION_INDEX[ahead] for ahead in NEIGHBOR_TABLE[pos])
+        for pos in ORDERED_VALID_POSITIONS
+    )
+
+
+NEIGHBOR_INDEX: Tuple[Tuple[int, ...], ...] = _build_neighbor_index_table()
+CELL_BIT: Tuple[int, ...] = tuple(1 << index for index in range(CELL_COUNT))
+
+
+def _build_ray_table() -> Tuple[Tuple[Tuple[int, ...], ...], ...]:
+    """Precompute, per cell id and direction, the cell ids stepped through until the rim."""
+    rays = []
+    for index in range(CELL_COUNT):
+        per_direction = []
+        for direction_index in range(len(DIRECTIONS)):
+            ray = []
+            ahead = NEIGHBOR_INDEX[index][direction_index]
+            while ahead >= 0:
+                ray.append(ahead)
+                ahead = NEIGHBOR_INDEX[ahead][direction_index]
+            per_direction.append(tuple(ray))
+        rays.append(tuple(per_direction))
+    return tuple(rays)
+
+
+RAYS: Tuple[Tuple[Tuple[int, ...], ...], ...] = _build_ray_table()
+
+
+def _iter_cell_ids(bitboard: int):
+    """Yield the cell ids of set bits in ascending order."""
+    while bitboard:
+        lowest = bitboard & -bitboard
+        yield lowest.bit_length() - 1
+        bitboard ^= lowest
+
 
 # --- Zobrist Hashing ---
 # Pre-computed random numbers for incrementally-maintained board hashing.
@@ -119,6 +166,12 @@ def _build_zobrist_table() -> Dict[Tuple[Position, int], int]:
     return table
 
 ZOBRIST: Dict = _build_zobrist_table()
+# Same keys indexed by [cell id][color], with 0 for EMPTY so updates need no branch.
+ZOBRIST_CELL: Tuple[Tuple[int, int, int], ...] = tuple(
+    (0, ZOBRIST[(pos, BLACK)], ZOBRIST[(pos, WHITE)]) for pos in ORDERED_VALID_POSITIONS
+)
+# Side-to-move keys indexed by player id.
+ZOBRIST_SIDE: Tuple[int, int, int] = (0, ZOBRIST[('side', BLACK)], ZOBRIST[('side', WHITE)])
 
 
 def pos_to_str(pos: Position) -> str:
@@ -126,6 +179,11 @@ def pos_to_str(pos: Position) -> str:
     return f"{ROW_LETTERS[pos[0]]}{pos[1]}"
 
 
+# Notation labels per cell id, and the same labels keyed by position.
+CELL_LABELS: Tuple[str, ...] = tuple(pos_to_str(pos) for pos in ORDERED_VALID_POSITIONS)
+POS_TO_STR: Dict[Position, str] = dict(zip(ORDERED_VALID_POSITIONS, CELL_LABELS))
+
+
 def str_to_pos(s: str) -> Position:
     """Convert notation like `e5` into an internal `(row, col)` tuple."""
     return (ROW_LETTERS.index(s[0]), int(s[1]))
@@ -176,17 +234,22 @@ def _ordered_marbles_for_direction(
         return marbles
 
     dr, dc = direction
+    first, last = marbles[0], marbles[-1]
+    if count == 2 or (
+        count == 3
+        and marbles[1][0] * 2 == first[0] + last[0]
+        and marbles[1][1] * 2 == first[1] + last[1]
+    ):
+        # Evenly spaced marbles project monotonically, so comparing the endpoints is enough.
+        if first[0] * dr + first[1] * dc <= last[0] * dr + last[1] * dc:
+            return marbles
+        return marbles[::-1]
+
     decorated = [
         (marble[0] * dr + marble[1] * dc, marble)
         for marble in marbles
     ]
 
-    if count == 2:
-        first, second = decorated
-        if first[0] <= second[0]:
-            return (first[1], second[1])
-        return (second[1], first[1])
-
     if count == 3:
         first, second, third = decorated
         if first[0] > second[0]:
@@ -202,7 +265,7 @@ def _ordered_marbles_for_direction(
 
 # --- Move ---
 
-@dataclass(frozen=True, slots=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class Move:
     """Immutable move payload used by both game logic and search."""
 
@@ -211,6 +274,8 @@ class Move:
     _count: int = field(init=False, repr=False, compare=False)
     _sorted_marbles: Tuple[Position, ...] = field(init=False, repr=False, compare=False)
     _ordered_marbles: Tuple[Position, ...] = field(init=False, repr=False, compare=False)
+    _ordered_ids: Tuple[int, ...] = field(init=False, repr=False, compare=False)
+    _direction_index: int = field(init=False, repr=False, compare=False)
     _line_dir: Optional[Direction] = field(init=False, repr=False, compare=False)
     _is_inline: bool = field(init=False, repr=False, compare=False)
     _leading: Position = field(init=False, repr=False, compare=False)
@@ -218,6 +283,7 @@ class Move:
     _ordering_key: Tuple[int, Position, int, Position, str] = field(init=False, repr=False, compare=False)
     _notation_plain: Optional[str] = field(init=False, repr=False, compare=False, default=None)
     _notation_pushed: Optional[str] = field(init=False, repr=False, compare=False, default=None)
+    _hash: int = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
         """Normalize marble order and cache derived geometry once."""
@@ -230,16 +296,34 @@ class Move:
         move._set_cached_geometry(marbles, direction, canonical=True)
         return move
 
+    @classmethod
+    def from_canonical_ids(cls, marble_ids: Tuple[int, ...], direction_index: int) -> "Move":
+        """Build a move from canonical (ascending) cell ids and a direction index."""
+        move = object.__new__(cls)
+        positions = ORDERED_VALID_POSITIONS
+        move._set_cached_geometry(
+            tuple(positions[index] for index in marble_ids),
+            DIRECTIONS[direction_index],
+            canonical=True,
+            marble_ids=marble_ids,
+            direction_index=direction_index,
+        )
+        return move
+
     def _set_cached_geometry(
         self,
         marbles: Tuple[Position, ...],
         direction: Direction,
         *,
         canonical: bool,
+        marble_ids: Optional[Tuple[int, ...]] = None,
+        direction_index: Optional[int] = None,
     ) -> None:
         """Populate the canonical move state and derived caches."""
         sorted_marbles = marbles if canonical else _canonicalize_marbles(marbles)
-        direction = (int(direction[0]), int(direction[1]))
+        if direction_index is None:
+            direction = (int(direction[0]), int(direction[1]))
+            direction_index = DIRECTION_INDEX.get(direction, OFF_BOARD)
         count = len(sorted_marbles)
 
         if count <= 1:
@@ -278,6 +362,22 @@ class Move:
         object.__setattr__(self, "_count", count)
         object.__setattr__(self, "_sorted_marbles", sorted_marbles)
         object.__setattr__(self, "_ordered_marbles", ordered_marbles)
+        if marble_ids is not None and ordered_marbles is sorted_marbles:
+            ordered_ids = marble_ids
+        elif marble_ids is not None and ordered_marbles[0] is sorted_marbles[-1]:
+            ordered_ids = marble_ids[::-1]
+        else:
+            ordered_ids = tuple(POSITION_INDEX.get(marble, OFF_BOARD) for marble in ordered_marbles)
+        if direction_index >= 0 and min(ordered_ids) >= 0:
+            # The moved-cell bitmask plus direction identifies an on-board move regardless of marble order.
+            cell_mask = 0
+            for index in ordered_ids:
+                cell_mask |= CELL_BIT[index]
+            move_hash = hash((cell_mask << 3) | direction_index)
+        else:
+            move_hash = hash((sorted_marbles, direction))
+        object.__setattr__(self, "_ordered_ids", ordered_ids)
+        object.__setattr__(self, "_direction_index", direction_index)
         object.__setattr__(self, "_line_dir", line_dir)
         object.__setattr__(self, "_is_inline", is_inline)
         object.__setattr__(self, "_leading", leading)
@@ -285,12 +385,37 @@ class Move:
         object.__setattr__(self, "_ordering_key", ordering_key)
         object.__setattr__(self, "_notation_plain", None)
         object.__setattr__(self, "_notation_pushed", None)
+        object.__setattr__(self, "_hash", move_hash)
+
+    def __hash__(self) -> int:
+        """Return the hash packed once at construction."""
+        return self._hash
+
+    def __eq__(self, other) -> bool:
+        """Compare canonical marbles and direction, rejecting on the cached hash first."""
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (
+            self._hash == other._hash
+            and self.marbles == other.marbles
+            and self.direction == other.direction
+        )
 
     @property
     def count(self) -> int:
         """Number of marbles in this move."""
         return self._count
 
+    @property
+    def direction_index(self) -> int:
+        """Index of `direction` in `DIRECTIONS`, or `OFF_BOARD` for a non-unit vector."""
+        return self._direction_index
+
+    @property
+    def trailing_id(self) -> int:
+        """Canonical cell id of the trailing marble along `direction`."""
+        return self._ordered_ids[0]
+
     @property
     def is_inline(self) -> bool:
         """Return whether movement is along the marble line (inline) vs broadside."""
@@ -318,7 +443,7 @@ class Move:
         else:
             start = pos_to_str(self._sorted_marbles[0])
             end = pos_to_str(self._sorted_marbles[-1])
-            dir_name = DIRECTION_NAMES[self.direction]
+            dir_name = DIRECTION_NAME_BY_INDEX[self._direction_index]
             notation = f"{self.count}:{start}-{end}>{dir_name}"
 
         if pushed:
@@ -373,31 +498,118 @@ LAYOUTS = {
 }
 
 
+def _build_display_template() -> Tuple[str, Tuple[int, ...]]:
+    """Build the static board drawing with one placeholder per cell, plus the cell ids in fill order."""
+    lines = []
+    order = []
+    for r in range(8, -1, -1):
+        letter = ROW_LETTERS[r]
+        indent = abs(r - 4)
+        if r <= 4:
+            cols = range(1, 6 + r)
+        else:
+            cols = range(r - 3, 10)
+        order.extend(POSITION_INDEX[(r, c)] for c in cols)
+        # Placeholders are two characters wide, matching every rendered cell.
+        row_str = f"  {'  ' * indent}{' '.join('{}' for _ in cols)}"
+        lines.append(f"{row_str:<40s}{letter}")
+    lines.append("")
+    return '\n'.join(lines), tuple(order)
+
+
+_DISPLAY_TEMPLATE, _DISPLAY_ORDER = _build_display_template()
+_DISPLAY_SYMBOLS: Tuple[str, str, str] = ("", "@@", "OO")  # indexed by color; empty cells show their label
+
+
+class BoardCells(Mapping):
+    """Position-keyed mapping view over a board's id-indexed cell bytes."""
+
+    __slots__ = ("_board", "_data")
+
+    def __init__(self, board: 'Board'):
+        """Wrap the board's backing `bytearray` without copying it."""
+        self._board = board
+        self._data = board._cells
+
+    def __getitem__(self, pos: Position) -> int:
+        """Return the cell value at `pos`, raising `KeyError` for off-board coordinates."""
+        return self._data[POSITION_INDEX[pos]]
+
+    def __setitem__(self, pos: Position, value: int) -> None:
+        """Write a cell value at `pos`, raising `KeyError` for off-board coordinates."""
+        self._board._set_cell(POSITION_INDEX[pos], value)
+
+    def get(self, pos: Position, default: Optional[int] = None) -> Optional[int]:
+        """Return the cell value at `pos`, or `default` for off-board coordinates."""
+        index = POSITION_INDEX.get(pos)
+        return default if index is None else self._data[index]
+
+    def __contains__(self, pos: object) -> bool:
+        """Return whether `pos` is a playable coordinate."""
+        return pos in POSITION_INDEX
+
+    def __iter__(self):
+        """Iterate playable coordinates in cell-id order."""
+        return iter(ORDERED_VALID_POSITIONS)
+
+    def __len__(self) -> int:
+        """Return the number of playable cells."""
+        return CELL_COUNT
+
+    def items(self):
+        """Iterate `(position, value)` pairs in cell-id order."""
+        return zip(ORDERED_VALID_POSITIONS, bytes(self._data))
+
+    def values(self) -> bytes:
+        """Return a snapshot of cell values in cell-id order."""
+        return bytes(self._data)
+
+
 class Board:
     """Mutable board state and authoritative move legality/application rules."""
 
     def __init__(self):
         """Initialize an empty board and zeroed capture score."""
-        self.cells: Dict[Position, int] = {pos: EMPTY for pos in VALID_POSITIONS}
-        self.score: Dict[int, int] = {BLACK: 0, WHITE: 0}
+        self._cells = bytearray(CELL_COUNT)  # cell values indexed by POSITION_INDEX ids
+        self._bits = [0, 0, 0]  # occupancy bitboards indexed by color, bit i = cell id i
+        self._cell_view = BoardCells(self)
+        self.score: List[int] = [0, 0, 0]  # captures indexed by player id, slot 0 unused
         self.zhash: int = 0  # Zobrist hash maintained incrementally
+        self._display_cache: Tuple[Optional[Tuple[int, int, int]], str] = (None, "")
+
+    @property
+    def cells(self) -> BoardCells:
+        """Position-keyed view over the board cells, kept for coordinate-based callers."""
+        return self._cell_view
+
+    def cell_bytes(self) -> bytes:
+        """Return one byte per cell in `ORDERED_VALID_POSITIONS` order."""
+        return bytes(self._cells)
+
+    def _set_cell(self, index: int, value: int):
+        """Write one cell and keep the color bitboards and Zobrist hash in sync."""
+        cells = self._cells
+        bits = self._bits
+        bit = CELL_BIT[index]
+        keys = ZOBRIST_CELL[index]
+        old = cells[index]
+        if old != EMPTY:
+            bits[old] &= ~bit
+        if value != EMPTY:
+            bits[value] |= bit
+        self.zhash ^= keys[old] ^ keys[value]
+        cells[index] = value
 
     def recompute_zhash(self):
         """Recompute Zobrist hash from scratch (used after bulk setup)."""
         h = 0
-        for pos, color in self.cells.items():
-            if color != EMPTY:
-                h ^= ZOBRIST[(pos, color)]
+        for index, color in enumerate(self._cells):
+            h ^= ZOBRIST_CELL[index][color]
         self.zhash = h
 
     def setup_standard(self):
         """Set marbles to the standard Abalone starting position."""
-        self.clear()
-        for pos in STANDARD_BLACK:
-            self.cells[pos] = BLACK
-        for pos in STANDARD_WHITE:
-            self.cells[pos] = WHITE
-        self.recompute_zhash()
+        self.setup_layout("standard")
 
     def setup_layout(self, name: str):
         """Set up board using a named layout."""
@@ -406,34 +618,44 @@ class Board:
         black_positions, white_positions = LAYOUTS[name]
         self.clear()
         for pos in black_positions:
-            self.cells[pos] = BLACK
+            self._set_cell(POSITION_INDEX[pos], BLACK)
         for pos in white_positions:
-            self.cells[pos] = WHITE
-        self.recompute_zhash()
+            self._set_cell(POSITION_INDEX[pos], WHITE)
 
     def clear(self):
         """Remove all marbles and reset scores."""
-        for pos in ORDERED_VALID_POSITIONS:
-            self.cells[pos] = EMPTY
-        self.score = {BLACK: 0, WHITE: 0}
+        self._cells[:] = bytes(CELL_COUNT)
+        self._bits = [0, 0, 0]
+        self.score = [0, 0, 0]
         self.zhash = 0
 
     def copy(self) -> 'Board':
-        """Create a deep copy of board cells, score state, and Zobrist hash."""
-        b = Board()
-        b.cells = dict(self.cells)
-        b.score = dict(self.score)
+        """Create a deep copy of board cells, score state, and Zobrist hash.
+
+        Skips `__init__` so the copy clones the cell bytes once instead of
+        zero-filling them first.
+        """
+        b = Board.__new__(Board)
+        b._cells = bytearray(self._cells)
+        b._bits = self._bits[:]
+        b._cell_view = BoardCells(b)
+        b.score = self.score.copy()
         b.zhash = self.zhash
+        b._display_cache = self._display_cache
         return b
 
+    def score_by_player(self) -> Dict[int, int]:
+        """Return the capture score as a `{BLACK: n, WHITE: n}` dict for serialization."""
+        score = self.score
+        return {BLACK: score[BLACK], WHITE: score[WHITE]}
+
     def to_compact_token(self) -> str:
         """Serialize occupied cells plus capture score into a compact deterministic token."""
         occupied = []
-        for pos in sorted(self.cells):
-            color = self.cells[pos]
+        for index, color in enumerate(self._cells):
             if color == EMPTY:
                 continue
-            occupied.append(f"{pos_to_str(pos)}{'b' if color == BLACK else 'w'}")
+            occupied.append(f"{CELL_LABELS[index]}{'b' if color == BLACK else 'w'}")
         return f"{','.join(occupied)}|{self.score[BLACK]}-{self.score[WHITE]}"
 
     @classmethod
@@ -456,28 +678,29 @@ class Board:
                 board.cells[pos] = BLACK if color_char == "b" else WHITE
         if score_part:
             black_score, white_score = score_part.split("-", 1)
-            board.score = {BLACK: int(black_score), WHITE: int(white_score)}
+            board.score = [0, int(black_score), int(white_score)]
         board.recompute_zhash()
         return board
 
     def get(self, pos: Position) -> Optional[int]:
         """Return marble color at a coordinate, or `None` for unknown coordinates."""
-        return self.cells.get(pos)
+        index = POSITION_INDEX.get(pos)
+        return None if index is None else self._cells[index]
 
     def get_marbles(self, player: int) -> List[Position]:
         """Return sorted coordinates for all marbles owned by `player`."""
-        cells = self.cells
-        return [pos for pos in ORDERED_VALID_POSITIONS if cells[pos] == player]
+        positions = ORDERED_VALID_POSITIONS
+        return [positions[index] for index in _iter_cell_ids(self._bits[player])]
 
     def marble_count(self, player: int) -> int:
         """Return number of marbles currently on board for `player`."""
-        return sum(1 for v in self.cells.values() if v == player)
+        return self._bits[player].bit_count()
 
     # --- Move validation ---
 
     def is_legal_move(self, move: Move, player: int) -> bool:
         """Validate move ownership, marble formation, and direction-specific constraints."""
-        if not self._owns_marbles(move.marbles, player):
+        if not self._owns_marbles(move._ordered_ids, player):
             return False
         if not self._marbles_in_line(move.marbles):
             return False
@@ -497,7 +720,7 @@ class Board:
         direction_index = DIRECTION_INDEX[direction]
         count = len(marbles)
         if count <= 1:
-            return self._check_single_raw(marbles[0], direction_index)
+            return self._check_single_raw(POSITION_INDEX[marbles[0]], direction_index)
 
         line_dir = (
             marbles[1][0] - marbles[0][0],
@@ -505,16 +728,19 @@ class Board:
         )
         if direction == line_dir or direction == OPPOSITE_DIRECTION.get(line_dir, opposite_dir(line_dir)):
             leading = marbles[-1] if direction == line_dir else marbles[0]
-            opponent = WHITE if player == BLACK else BLACK
-            return self._check_inline_raw(leading, count, direction_index, player, opponent)
+            opponent = OPPONENT[player]
+            return self._check_inline_raw(POSITION_INDEX[leading], count, direction_index, player, opponent)
 
-        return self._check_broadside_raw(marbles, direction_index)
+        return self._check_broadside_raw(
+            tuple(POSITION_INDEX[marble] for marble in marbles),
+            direction_index,
+        )
 
-    def _owns_marbles(self, marbles: Tuple[Position, ...], player: int) -> bool:
-        """Return whether all selected coordinates belong to the given player."""
-        cells = self.cells
-        for marble in marbles:
-            if cells.get(marble) != player:
+    def _owns_marbles(self, marble_ids: Tuple[int, ...], player: int) -> bool:
+        """Return whether all selected cell ids are on the board and belong to the given player."""
+        owned = self._bits[player]
+        for index in marble_ids:
+            if index < 0 or not owned & CELL_BIT[index]:
                 return False
         return True
 
@@ -523,44 +749,69 @@ class Board:
         if len(marbles) <= 1:
             return True
         start = marbles[0]
-        d = (marbles[1][0] - start[0], marbles[1][1] - start[1])
-        if d not in DIRECTION_SET:
+        direction_index = _DIRECTION_CODE_INDEX.get((marbles[1][0] - start[0]) * 16 + marbles[1][1] - start[1])
+        index = POSITION_INDEX.get(start, OFF_BOARD)
+        if direction_index is None or index < 0:
             return False
-        for index in range(2, len(marbles)):
-            expected = (start[0] + index * d[0], start[1] + index * d[1])
-            if marbles[index] != expected:
+        for marble in marbles[1:]:
+            index = NEIGHBOR_INDEX[index][direction_index]
+            if index < 0 or ORDERED_VALID_POSITIONS[index] != marble:
                 return False
         return True
 
+    def would_push(self, move: Move, player: int) -> bool:
+        """Return whether a multi-marble inline move is currently facing an opponent marble."""
+        if not move._is_inline or move._count < 2:
+            return False
+        ahead = NEIGHBOR_INDEX[move._ordered_ids[-1]][move._direction_index]
+        return ahead >= 0 and self._bits[OPPONENT[player]] & CELL_BIT[ahead] != 0
+
+    def move_score(self, move: Move, player: int) -> int:
+        """Return a cheap ordering score for a legal move: 1000 push-off, 100 other push, 0 quiet."""
+        if not move._is_inline or move._count < 2:
+            return 0
+        cells = self._cells
+        ray = RAYS[move._ordered_ids[-1]][move._direction_index]
+        opponent = OPPONENT[player]
+        if not ray or cells[ray[0]] != opponent:
+            return 0
+        end = len(ray)
+        i = 1
+        while i < end and cells[ray[i]] == opponent:
+            i += 1
+        return 1000 if i == end else 100
+
     def _is_directionally_legal(self, move: Move, player: int) -> bool:
         """Validate the occupancy and push rules once shape has been established."""
-        opponent = WHITE if player == BLACK else BLACK
-        if move.is_inline:
-            return self._check_inline_raw(move._leading, move.count, DIRECTION_INDEX[move.direction], player, opponent)
-        return self._check_broadside_raw(move.marbles, DIRECTION_INDEX[move.direction])
+        direction_index = move._direction_index
+        if direction_index < 0:
+            return False
+        opponent = OPPONENT[player]
+        if move._is_inline:
+            return self._check_inline_raw(move._ordered_ids[-1], move._count, direction_index, player, opponent)
+        return self._check_broadside_raw(move._ordered_ids, direction_index)
 
-    def _check_single_raw(self, marble: Position, direction_index: int) -> bool:
+    def _check_single_raw(self, marble: int, direction_index: int) -> bool:
         """Validate a generated single-marble move."""
-        cells = self.cells
-        ahead = NEIGHBOR_TABLE[marble][direction_index]
-        return ahead is not None and cells[ahead] == EMPTY
+        ahead = NEIGHBOR_INDEX[marble][direction_index]
+        return ahead >= 0 and self._cells[ahead] == EMPTY
 
     def _check_inline_raw(
         self,
-        leading: Position,
+        leading: int,
         count: int,
         direction_index: int,
         player: int,
         opponent: int,
     ) -> bool:
         """Validate an inline move, including sumito push rules."""
-        cells = self.cells
-        ahead = NEIGHBOR_TABLE[leading][direction_index]
+        cells = self._cells
+        ray = RAYS[leading][direction_index]
 
-        if ahead is None:
+        if not ray:
             return False  # can't move own marble off board
 
-        ahead_value = cells[ahead]
+        ahead_value = cells[ray[0]]
         if ahead_value == EMPTY:
             return True
 
@@ -568,188 +819,147 @@ class Board:
             return False  # can't push own marble
 
         # Count contiguous opponent marbles ahead
-        pushed_count = 0
-        pos = ahead
-        while pos is not None and cells[pos] == opponent:
+        end = len(ray)
+        pushed_count = 1
+        while pushed_count < end and cells[ray[pushed_count]] == opponent:
             pushed_count += 1
-            pos = NEIGHBOR_TABLE[pos][direction_index]
 
         # Must outnumber
         if pushed_count >= count:
             return False
 
         # Space after pushed marbles must be empty or off-board
-        if pos is not None and cells[pos] != EMPTY:
-            return False
-
-        return True
+        return pushed_count == end or cells[ray[pushed_count]] == EMPTY
 
-    def _check_broadside_raw(self, marbles: Tuple[Position, ...], direction_index: int) -> bool:
+    def _check_broadside_raw(self, marble_ids: Tuple[int, ...], direction_index: int) -> bool:
         """Validate broadside movement where every destination must be empty and valid."""
-        cells = self.cells
-        neighbors = NEIGHBOR_TABLE
-        for m in marbles:
-            dest = neighbors[m][direction_index]
-            if dest is None:
-                return False
-            if cells[dest] != EMPTY:
+        occupied = self._bits[BLACK] | self._bits[WHITE]
+        neighbors = NEIGHBOR_INDEX
+        for index in marble_ids:
+            dest = neighbors[index][direction_index]
+            if dest < 0 or occupied & CELL_BIT[dest]:
                 return False
         return True
 
     # --- Apply move ---
 
-    def _zhash_set(self, pos: Position, color: int):
-        """XOR a (pos, color) pair into the Zobrist hash."""
-        if color != EMPTY:
-            self.zhash ^= ZOBRIST[(pos, color)]
-
     def apply_move(self, move: Move, player: int) -> dict:
         """Apply move, mutating the board. Returns result info."""
-        result = {'pushed': [], 'pushoff': False}
-        opponent = WHITE if player == BLACK else BLACK
-
-        if move.is_inline:
-            self._apply_inline(move, player, opponent, result)
-        else:
-            self._apply_broadside(move, player)
+        return self.move_result(self.apply_move_undo(move, player))
 
-        return result
+    @staticmethod
+    def move_result(undo_info: dict) -> dict:
+        """Return the pushed-marble summary recorded in an `apply_move_undo` token."""
+        return {
+            'pushed': [CELL_LABELS[index] for index in undo_info['pushed']],
+            'pushoff': undo_info['pushoff'],
+        }
 
     def apply_move_undo(self, move: Move, player: int) -> dict:
-        """Apply move and return an undo token for fast rollback in search.
+        """Apply move and return an undo token for fast rollback.
 
         The undo token captures all cell changes and score deltas so that
-        ``undo_move`` can restore the board without allocating a copy.
+        ``undo_move`` can restore the board without allocating a copy. It also
+        records the pushed cell ids and push-off flag for ``move_result``.
         """
-        opponent = WHITE if player == BLACK else BLACK
+        opponent = OPPONENT[player]
         # snapshot changes for undo
-        old_cells: List[Tuple[Position, int]] = []
+        old_cells: List[Tuple[int, int]] = []
         old_score_player = self.score[player]
         old_score_opponent = self.score[opponent]
         old_zhash = self.zhash
-
-        cells = self.cells
-        d = move.direction
-        direction_index = DIRECTION_INDEX[d]
-        if move.is_inline:
+        bits = self._bits
+        old_bits = (bits[BLACK], bits[WHITE])
+
+        cells = self._cells
+        neighbors = NEIGHBOR_INDEX
+        keys = ZOBRIST_CELL
+        h = old_zhash
+        direction_index = move._direction_index
+        moved = landed = 0
+        pushed = []
+        pushoff = False
+        if move._is_inline:
             # Find pushed opponent marbles
-            pushed = []
-            pos = NEIGHBOR_TABLE[move._leading][direction_index]
-            while pos is not None and cells[pos] == opponent:
-                pushed.append(pos)
-                pos = NEIGHBOR_TABLE[pos][direction_index]
+            index = neighbors[move._ordered_ids[-1]][direction_index]
+            while index >= 0 and cells[index] == opponent:
+                pushed.append(index)
+                index = neighbors[index][direction_index]
 
             # Handle push-off
-            pushoff = pushed and pos is None
+            pushoff = bool(pushed) and index < 0
             if pushoff:
                 self.score[player] += 1
 
             # Move pushed (farthest first)
+            pushed_from = pushed_to = 0
             for i in range(len(pushed) - 1, -1, -1):
                 p = pushed[i]
                 old_cells.append((p, cells[p]))
-                self._zhash_set(p, cells[p])  # remove old
-                dest = NEIGHBOR_TABLE[p][direction_index]
-                if dest is not None:
+                h ^= keys[p][cells[p]]  # remove old
+                pushed_from |= CELL_BIT[p]
+                dest = neighbors[p][direction_index]
+                if dest >= 0:
                     old_cells.append((dest, cells[dest]))
                     cells[dest] = opponent
-                    self._zhash_set(dest, opponent)  # add new
+                    h ^= keys[dest][opponent]  # add new
+                    pushed_to |= CELL_BIT[dest]
                 cells[p] = EMPTY
+            if pushed:
+                bits[opponent] = (bits[opponent] & ~pushed_from) | pushed_to
 
             # Move own marbles (leading first)
-            for marble in reversed(move._ordered_marbles):
+            for marble in reversed(move._ordered_ids):
                 old_cells.append((marble, cells[marble]))
-                self._zhash_set(marble, cells[marble])  # remove old
-                dest = NEIGHBOR_TABLE[marble][direction_index]
+                h ^= keys[marble][cells[marble]]  # remove old
+                dest = neighbors[marble][direction_index]
                 old_cells.append((dest, cells[dest]))
                 cells[dest] = player
-                self._zhash_set(dest, player)  # add new
+                h ^= keys[dest][player]  # add new
                 cells[marble] = EMPTY
+                moved |= CELL_BIT[marble]
+                landed |= CELL_BIT[dest]
         else:
             # Broadside
-            for m in move.marbles:
+            for m in move._ordered_ids:
                 old_cells.append((m, cells[m]))
-                self._zhash_set(m, cells[m])  # remove old
+                h ^= keys[m][cells[m]]  # remove old
                 cells[m] = EMPTY
-            for m in move.marbles:
-                dest = NEIGHBOR_TABLE[m][direction_index]
+                moved |= CELL_BIT[m]
+            for m in move._ordered_ids:
+                dest = neighbors[m][direction_index]
                 old_cells.append((dest, cells[dest]))
                 cells[dest] = player
-                self._zhash_set(dest, player)  # add new
+                h ^= keys[dest][player]  # add new
+                landed |= CELL_BIT[dest]
+        bits[player] = (bits[player] & ~moved) | landed
+        self.zhash = h
 
         return {
             'old_cells': old_cells,
+            'old_bits': old_bits,
             'player': player,
             'opponent': opponent,
             'old_score_p': old_score_player,
             'old_score_o': old_score_opponent,
             'old_zhash': old_zhash,
+            'pushed': pushed,
+            'pushoff': pushoff,
         }
 
     def undo_move(self, undo_info: dict):
         """Restore board from undo token produced by apply_move_undo."""
         player = undo_info['player']
         opponent = undo_info['opponent']
+        cells = self._cells
         # Restore cells in reverse order
-        for pos, val in reversed(undo_info['old_cells']):
-            self.cells[pos] = val
+        for index, val in reversed(undo_info['old_cells']):
+            cells[index] = val
+        self._bits[BLACK], self._bits[WHITE] = undo_info['old_bits']
         self.score[player] = undo_info['old_score_p']
         self.score[opponent] = undo_info['old_score_o']
         self.zhash = undo_info['old_zhash']
 
-    def _apply_inline(self, move: Move, player: int, opponent: int, result: dict):
-        """Apply an inline move, including pushes and potential push-off scoring."""
-        cells = self.cells
-        direction_index = DIRECTION_INDEX[move.direction]
-
-        # Find pushed opponent marbles
-        pushed = []
-        pos = NEIGHBOR_TABLE[move._leading][direction_index]
-        while pos is not None and cells[pos] == opponent:
-            pushed.append(pos)
-            pos = NEIGHBOR_TABLE[pos][direction_index]
-        # pos = first cell after pushed chain (empty or off-board)
-
-        result['pushed'] = [pos_to_str(p) for p in pushed]
-
-        # Handle push-off
-        if pushed and pos is None:
-            result['pushoff'] = True
-            self.score[player] += 1
-
-        # Move pushed opponent marbles (farthest first)
-        for i in range(len(pushed) - 1, -1, -1):
-            p = pushed[i]
-            self._zhash_set(p, cells[p])
-            dest = NEIGHBOR_TABLE[p][direction_index]
-            if dest is not None:
-                self._zhash_set(dest, cells[dest])
-                cells[dest] = opponent
-                self._zhash_set(dest, opponent)
-            cells[p] = EMPTY
-
-        # Move own marbles (leading first to avoid overwriting)
-        for marble in reversed(move._ordered_marbles):
-            self._zhash_set(marble, cells[marble])
-            dest = NEIGHBOR_TABLE[marble][direction_index]
-            self._zhash_set(dest, cells[dest])
-            cells[dest] = player
-            self._zhash_set(dest, player)
-            cells[marble] = EMPTY
-
-    def _apply_broadside(self, move: Move, player: int):
-        """Apply a broadside move after legality has already been established."""
-        cells = self.cells
-        direction_index = DIRECTION_INDEX[move.direction]
-        # Clear old, set new (safe because broadside dests are always empty)
-        for m in move.marbles:
-            self._zhash_set(m, cells[m])
-            cells[m] = EMPTY
-        for m in move.marbles:
-            dest = NEIGHBOR_TABLE[m][direction_index]
-            cells[dest] = player
-            self._zhash_set(dest, player)
-
     # --- Display ---
 
     def display(self, last_move: Optional[Move] = None) -> str:
@@ -767,32 +977,18 @@ class Board:
            @@ @@ @@ @@ @@ @@              b
              @@ @@ @@ @@ @@               a
         """
-        lines = []
-        lines.append("")
-        lines.append(f"  Score: Black(@@) {self.score[BLACK]} - {self.score[WHITE]} White(OO)")
-        lines.append("")
-
-        for r in range(8, -1, -1):
-            letter = ROW_LETTERS[r]
-            indent = abs(r - 4)
-            if r <= 4:
-                cols = range(1, 6 + r)
-            else:
-                cols = range(r - 3, 10)
-
-            cells = []
-            for c in cols:
-                val = self.cells[(r, c)]
-                if val == BLACK:
-                    cells.append('@@')
-                elif val == WHITE:
-                    cells.append('OO')
-                else:
-                    cells.append(f"{letter}{c}")
-
-            row_str = f"  {'  ' * indent}{' '.join(cells)}"
-            row_str = f"{row_str:<40s}{letter}"
-            lines.append(row_str)
-
-        lines.append("")
-        return '\n'.join(lines)
+        # The rendering depends only on occupancy and score, so reuse it until either changes.
+        key = (self.zhash, self.score[BLACK], self.score[WHITE])
+        cached_key, text = self._display_cache
+        if key == cached_key:
+            return text
+
+        header = f"\n  Score: Black(@@) {self.score[BLACK]} - {self.score[WHITE]} White(OO)\n\n"
+        cells = self._cells
+        labels = CELL_LABELS
+        symbols = _DISPLAY_SYMBOLS
+        text = header + _DISPLAY_TEMPLATE.format(
+            *[symbols[cells[index]] or labels[index] for index in _DISPLAY_ORDER]
+        )
+        self._display_cache = (key, text)
+        return text
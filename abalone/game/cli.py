@@ -1,23 +1,59 @@
 """Abalone terminal game loop with optional AI players."""
 
-from typing import Optional
+import re
+import sys
+from typing import Dict, Optional, Tuple
 
 from ..players.registry import DEFAULT_BLACK_AI_ID, DEFAULT_WHITE_AI_ID
-from ..state_space import generate_legal_moves, print_state_space_summary
 from .board import (
     BLACK,
     WHITE,
     DIRECTIONS,
     NAME_TO_DIR,
+    VALID_POSITIONS,
+    Direction,
     Move,
-    is_valid,
-    neighbor,
+    Position,
     pos_to_str,
     str_to_pos,
 )
 from .config import CONTROLLER_AI, GameConfig, MODE_HVH
 from .session import GameSession
 
+# `{count}:{trailing}{goal}` inline (optionally `*`-marked as a push), or
+# `{count}:{end1}-{end2}>{DIR}` broadside.
+_MOVE_RE = re.compile(r"(\d):([a-i]\d)(?:([a-i]\d)\*?|-([a-i]\d)>((?i:ne|nw|se|sw|e|w)))")
+_DIRECTION_SET = frozenset(DIRECTIONS)
+
+# Per-turn header and move-result lines, each written to stdout in one call.
+_TURN_TEMPLATE = "{board}\n  Turn: {pname} [{controller}]\n  Marbles: B={black} W={white}\n\n"
+_PUSHED_TEMPLATE = "     Pushed: {}\n"
+_PUSHOFF_LINE = "     PUSHED OFF THE BOARD!\n"
+_SEARCH_TEMPLATE = "     Search: depth={depth} nodes={nodes} time={elapsed_ms}ms\n"
+
+
+def _build_marble_lines() -> Dict[Tuple[Position, Direction, int], Tuple[Position, ...]]:
+    """Precompute every on-board straight line of 1-3 marbles, keyed by (start, unit step, count)."""
+    lines = {}
+    for start in VALID_POSITIONS:
+        for unit in DIRECTIONS:
+            for count in (1, 2, 3):
+                line = tuple((start[0] + i * unit[0], start[1] + i * unit[1]) for i in range(count))
+                if all(pos in VALID_POSITIONS for pos in line):
+                    lines[start, unit, count] = line
+    return lines
+
+
+_MARBLE_LINES = _build_marble_lines()
+
+
+def _marble_line(start: Position, unit: Direction, count: int) -> Tuple[Position, ...]:
+    """Return `count` marbles stepping from `start` by `unit`, shared from the table when on-board."""
+    line = _MARBLE_LINES.get((start, unit, count))
+    if line is None:
+        line = tuple((start[0] + i * unit[0], start[1] + i * unit[1]) for i in range(count))
+    return line
+
 
 class Game:
     """Interactive terminal game wrapper around `GameSession`."""
@@ -62,12 +98,17 @@ class Game:
         print("Type 'help' for commands.\n")
 
         while not self.is_game_over():
-            print(self.board.display())
             pname = "Black(@)" if self.current_player == BLACK else "White(O)"
             controller = self.session.current_controller
-            print(f"  Turn: {pname} [{controller.upper()}]")
-            print(f"  Marbles: B={self.board.marble_count(BLACK)} W={self.board.marble_count(WHITE)}")
-            print()
+            sys.stdout.write(
+                _TURN_TEMPLATE.format(
+                    board=self.board.display(),
+                    pname=pname,
+                    controller=controller.upper(),
+                    black=self.board.marble_count(BLACK),
+                    white=self.board.marble_count(WHITE),
+                )
+            )
 
             if controller == CONTROLLER_AI:
                 result = self.session.apply_agent_move()
@@ -76,18 +117,7 @@ class Game:
                     break
 
                 agent_label = result.get("agent_label") or "AI"
-                print(f"  >> {pname} ({agent_label}) plays {result['notation']}")
-                if result["result"]["pushed"]:
-                    print(f"     Pushed: {', '.join(result['result']['pushed'])}")
-                if result["result"]["pushoff"]:
-                    print("     PUSHED OFF THE BOARD!")
-                search = result.get("search")
-                if search:
-                    print(
-                        f"     Search: depth={search['depth']} nodes={search['nodes']} "
-                        f"time={search['elapsed_ms']}ms"
-                    )
-                print()
+                self._write_move_result(f"  >> {pname} ({agent_label}) plays {result['notation']}", result)
                 continue
 
             move = self._get_move()
@@ -103,20 +133,30 @@ class Game:
                 print(f"  {result['error']}")
                 continue
 
-            print(f"\n  >> {pname} plays {result['notation']}")
-            if result["result"]["pushed"]:
-                print(f"     Pushed: {', '.join(result['result']['pushed'])}")
-            if result["result"]["pushoff"]:
-                print("     PUSHED OFF THE BOARD!")
-            print()
+            self._write_move_result(f"\n  >> {pname} plays {result['notation']}", result)
 
         print(self.board.display())
         status = self.session.status()
         self._print_game_over(status)
 
+    @staticmethod
+    def _write_move_result(headline: str, result: dict) -> None:
+        """Write the applied-move summary block (pushes, push-off, search stats) in one call."""
+        parts = [headline, "\n"]
+        outcome = result["result"]
+        if outcome["pushed"]:
+            parts.append(_PUSHED_TEMPLATE.format(", ".join(outcome["pushed"])))
+        if outcome["pushoff"]:
+            parts.append(_PUSHOFF_LINE)
+        search = result.get("search")
+        if search:
+            parts.append(_SEARCH_TEMPLATE.format_map(search))
+        parts.append("\n")
+        sys.stdout.write("".join(parts))
+
     def is_game_over(self) -> bool:
         """Return whether the game has ended."""
-        return self.session.status()["game_over"]
+        return self.session.is_game_over()
 
     @staticmethod
     def _format_elapsed_ms(ms: int) -> str:
@@ -160,10 +200,22 @@ class Game:
         print(f"  GAME OVER! {wname} wins!")
         print(f"  Final score: Black {self.board.score[BLACK]} - {self.board.score[WHITE]} White")
 
+    @staticmethod
+    def _read_line(prompt: str) -> str:
+        """Read one input line; piped input skips `input()`'s per-call flush and readline hooks."""
+        if sys.stdin.isatty():
+            return input(prompt)
+        sys.stdout.write(prompt)
+        sys.stdout.flush()
+        line = sys.stdin.readline()
+        if not line:
+            raise EOFError
+        return line
+
     def _get_move(self) -> Optional[Move]:
         """Read user input, execute meta-commands, and parse a move if provided."""
         try:
-            raw = input("  Enter move> ").strip().lower()
+            raw = self._read_line("  Enter move> ").strip().lower()
         except (EOFError, KeyboardInterrupt):
             print()
             raise SystemExit
@@ -184,6 +236,8 @@ class Game:
             return None
 
         if raw == "state":
+            from ..state_space import print_state_space_summary
+
             print_state_space_summary(self.board, self.current_player)
             return None
 
@@ -204,55 +258,42 @@ class Game:
 
     def _parse_move(self, text: str) -> Optional[Move]:
         """Parse CLI notation into a `Move`, supporting inline and broadside forms."""
-        try:
-            if ">" in text:
-                # Broadside syntax: `{count}:{end1}-{end2}>{DIR}`.
-                head, dir_name = text.split(">")
-                dir_name = dir_name.upper()
-                if dir_name not in NAME_TO_DIR:
-                    return None
-
-                direction = NAME_TO_DIR[dir_name]
-                parts = head.split(":")
-                count = int(parts[0])
-                ends = parts[1].split("-")
-                end1 = str_to_pos(ends[0])
-                end2 = str_to_pos(ends[1])
-
-                line_d = (end2[0] - end1[0], end2[1] - end1[1])
-                steps = max(abs(line_d[0]), abs(line_d[1]))
-                if steps == 0 or steps != count - 1:
-                    return None
-
-                unit = (line_d[0] // steps, line_d[1] // steps)
-                marbles = tuple((end1[0] + i * unit[0], end1[1] + i * unit[1]) for i in range(count))
-                return Move(marbles=marbles, direction=direction)
-
-            parts = text.split(":")
-            # Inline syntax: `{count}:{trailing}{goal}`.
-            count = int(parts[0])
-            pos_str = parts[1]
-            start = str_to_pos(pos_str[:2])
-            goal = str_to_pos(pos_str[2:4])
-
-            dr = goal[0] - start[0]
-            dc = goal[1] - start[1]
-            if count == 0:
-                return None
-            if dr % count != 0 or dc % count != 0:
+        match = _MOVE_RE.fullmatch(text)
+        if match is None:
+            return None
+        count_text, first, goal_text, end_text, dir_name = match.groups()
+        count = int(count_text)
+        if count == 0:
+            return None
+        start = str_to_pos(first)
+
+        if end_text is not None:
+            # Broadside: marbles run from `first` to `end_text`, then shift by `dir_name`.
+            end = str_to_pos(end_text)
+            line_d = (end[0] - start[0], end[1] - start[1])
+            steps = max(abs(line_d[0]), abs(line_d[1]))
+            if steps == 0 or steps != count - 1:
                 return None
 
-            direction = (dr // count, dc // count)
-            if direction not in DIRECTIONS:
-                return None
+            unit = (line_d[0] // steps, line_d[1] // steps)
+            return Move(marbles=_marble_line(start, unit, count), direction=NAME_TO_DIR[dir_name.upper()])
+
+        goal = str_to_pos(goal_text)
+        dr = goal[0] - start[0]
+        dc = goal[1] - start[1]
+        if dr % count != 0 or dc % count != 0:
+            return None
 
-            marbles = tuple((start[0] + i * direction[0], start[1] + i * direction[1]) for i in range(count))
-            return Move(marbles=marbles, direction=direction)
-        except (ValueError, IndexError, KeyError):
+        direction = (dr // count, dc // count)
+        if direction not in _DIRECTION_SET:
             return None
 
+        return Move(marbles=_marble_line(start, direction, count), direction=direction)
+
     def _show_moves(self):
         """Print legal move list grouped by marble count and inline/broadside type."""
+        from ..state_space import generate_legal_moves
+
         legal = generate_legal_moves(self.board, self.current_player)
         if not legal:
             print("  No legal moves!")
@@ -262,46 +303,29 @@ class Game:
         doubles = [move for move in legal if move.count == 2]
         triples = [move for move in legal if move.count == 3]
 
-        print(f"\n  Legal moves ({len(legal)} total):")
+        # Collect every line first and emit the whole listing in one write.
+        lines = ["", f"  Legal moves ({len(legal)} total):"]
         if singles:
-            print(f"  Single ({len(singles)}):")
-            for move in singles:
-                print(f"    {move.to_notation()}")
+            lines.append(f"  Single ({len(singles)}):")
+            lines.extend(f"    {move.to_notation()}" for move in singles)
 
-        if doubles:
-            inline = [move for move in doubles if move.is_inline]
-            broad = [move for move in doubles if not move.is_inline]
-            if inline:
-                print(f"  Double inline ({len(inline)}):")
-                for move in inline:
-                    print(f"    {move.to_notation(pushed=self._would_push(move))}")
-            if broad:
-                print(f"  Double broadside ({len(broad)}):")
-                for move in broad:
-                    print(f"    {move.to_notation()}")
-
-        if triples:
-            inline = [move for move in triples if move.is_inline]
-            broad = [move for move in triples if not move.is_inline]
+        for label, group in (("Double", doubles), ("Triple", triples)):
+            if not group:
+                continue
+            inline = [move for move in group if move.is_inline]
+            broad = [move for move in group if not move.is_inline]
             if inline:
-                print(f"  Triple inline ({len(inline)}):")
-                for move in inline:
-                    print(f"    {move.to_notation(pushed=self._would_push(move))}")
+                lines.append(f"  {label} inline ({len(inline)}):")
+                lines.extend(f"    {move.to_notation(pushed=self._would_push(move))}" for move in inline)
             if broad:
-                print(f"  Triple broadside ({len(broad)}):")
-                for move in broad:
-                    print(f"    {move.to_notation()}")
-        print()
+                lines.append(f"  {label} broadside ({len(broad)}):")
+                lines.extend(f"    {move.to_notation()}" for move in broad)
+        lines.append("")
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def _would_push(self, move: Move) -> bool:
         """Return whether an inline move is currently facing an opponent marble."""
-        if not move.is_inline or move.count < 2:
-            return False
-
-        _, leading = move.leading_trailing()
-        ahead = neighbor(leading, move.direction)
-        opponent = WHITE if self.current_player == BLACK else BLACK
-        return is_valid(ahead) and self.board.cells.get(ahead) == opponent
+        return self.board.would_push(move, self.current_player)
 
     def _undo(self):
         """Undo the most recent move and print the outcome."""
@@ -1,9 +1,11 @@
 """Configuration helpers for game mode and controller wiring."""
 
 from dataclasses import dataclass
-from typing import Dict, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping, Optional
 
-from .board import BLACK, WHITE
+from .board import BLACK, OPPONENT, WHITE
 from ..players.registry import DEFAULT_BLACK_AI_ID, DEFAULT_WHITE_AI_ID
 
 MODE_HVH = "hvh"
@@ -16,6 +18,28 @@ CONTROLLER_AI = "ai"
 VALID_MODES = {MODE_HVH, MODE_HVA, MODE_AVA}
 VALID_LAYOUTS = {"standard", "belgian_daisy", "german_daisy"}
 
+# Every accepted (stripped, lower-cased) spelling of a human side.
+_HUMAN_SIDE_ALIASES = {
+    "black": BLACK,
+    "b": BLACK,
+    str(BLACK): BLACK,
+    "white": WHITE,
+    "w": WHITE,
+    str(WHITE): WHITE,
+}
+
+
+@lru_cache(maxsize=8)
+def _controllers_for(mode: str, human_side: int) -> Mapping[int, str]:
+    """Build the read-only controller mapping for one (mode, human side) pair."""
+    if mode == MODE_HVH:
+        controllers = {BLACK: CONTROLLER_HUMAN, WHITE: CONTROLLER_HUMAN}
+    elif mode == MODE_AVA:
+        controllers = {BLACK: CONTROLLER_AI, WHITE: CONTROLLER_AI}
+    else:
+        controllers = {human_side: CONTROLLER_HUMAN, OPPONENT[human_side]: CONTROLLER_AI}
+    return MappingProxyType(controllers)
+
 
 @dataclass(frozen=True)
 class GameConfig:
@@ -34,22 +58,15 @@ class GameConfig:
     player1_time_per_turn_s: int = 30
     player2_time_per_turn_s: int = 30
 
-    def controllers(self) -> Dict[int, str]:
-        """Return the per-color controller mapping derived from the selected mode."""
-        if self.mode == MODE_HVH:
-            return {BLACK: CONTROLLER_HUMAN, WHITE: CONTROLLER_HUMAN}
-        if self.mode == MODE_AVA:
-            return {BLACK: CONTROLLER_AI, WHITE: CONTROLLER_AI}
-
-        ai_side = WHITE if self.human_side == BLACK else BLACK
-        return {
-            self.human_side: CONTROLLER_HUMAN,
-            ai_side: CONTROLLER_AI,
-        }
+    def controllers(self) -> Mapping[int, str]:
+        """Return the shared, read-only per-color controller mapping for the selected mode."""
+        return _controllers_for(self.mode, self.human_side)
 
 
 def normalize_mode(value: object) -> str:
     """Normalize and validate game mode input."""
+    if isinstance(value, str) and value in VALID_MODES:
+        return value
     mode = str(value).strip().lower()
     if mode not in VALID_MODES:
         raise ValueError(f"Unsupported mode '{value}'.")
@@ -63,28 +80,29 @@ def normalize_human_side(value: object) -> int:
             return value
         raise ValueError("human_side must be 1 (black) or 2 (white).")
 
-    side = str(value).strip().lower()
-    if side in ("black", "b", str(BLACK)):
-        return BLACK
-    if side in ("white", "w", str(WHITE)):
-        return WHITE
-    raise ValueError(f"Unsupported human side '{value}'.")
+    side = _HUMAN_SIDE_ALIASES.get(str(value).strip().lower())
+    if side is None:
+        raise ValueError(f"Unsupported human side '{value}'.")
+    return side
 
 
 def normalize_depth(value: object) -> Optional[int]:
     """Normalize and validate an optional search-depth override for the AI agent."""
     if value is None:
         return None
-    if isinstance(value, str):
-        raw = value.strip().lower()
-        if raw in {"", "default", "preset", "agent"}:
-            return None
-    if isinstance(value, float) and not value.is_integer():
-        raise ValueError("ai_depth must be an integer.")
-    try:
-        depth = int(value)
-    except (TypeError, ValueError) as exc:
-        raise ValueError("ai_depth must be an integer.") from exc
+    if type(value) is int:
+        depth = value
+    else:
+        if isinstance(value, str):
+            raw = value.strip().lower()
+            if raw in {"", "default", "preset", "agent"}:
+                return None
+        if isinstance(value, float) and not value.is_integer():
+            raise ValueError("ai_depth must be an integer.")
+        try:
+            depth = int(value)
+        except (TypeError, ValueError) as exc:
+            raise ValueError("ai_depth must be an integer.") from exc
 
     if depth < 1 or depth > 10:
         raise ValueError("ai_depth must be between 1 and 10.")
@@ -95,6 +113,8 @@ def normalize_optional_non_negative_int(value: object, name: str) -> Optional[in
     """Convert an optional value to a non-negative integer with field-specific error text."""
     if value is None:
         return None
+    if type(value) is int:
+        return normalize_non_negative_int(value, name)
     if isinstance(value, str) and value.strip() == "":
         return None
     if isinstance(value, float) and not value.is_integer():
@@ -117,6 +137,8 @@ def normalize_ai_id(value: object) -> str:
 
 def normalize_board_layout(value: object) -> str:
     """Normalize and validate board layout identifier."""
+    if isinstance(value, str) and value in VALID_LAYOUTS:
+        return value
     layout = str(value).strip().lower()
     if layout not in VALID_LAYOUTS:
         raise ValueError(f"Unsupported board layout '{value}'.")
@@ -125,10 +147,13 @@ def normalize_board_layout(value: object) -> str:
 
 def normalize_non_negative_int(value: object, name: str) -> int:
     """Convert a value to a non-negative integer with field-specific error text."""
-    try:
-        v = int(value)
-    except (TypeError, ValueError) as exc:
-        raise ValueError(f"{name} must be an integer.") from exc
+    if type(value) is int:
+        v = value
+    else:
+        try:
+            v = int(value)
+        except (TypeError, ValueError) as exc:
+            raise ValueError(f"{name} must be an integer.") from exc
     if v < 0:
         raise ValueError(f"{name} must be non-negative.")
     return v
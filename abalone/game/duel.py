@@ -146,7 +146,7 @@ def _winner_with_tiebreak(base_label: str, winner_tiebreak: Optional[str]) -> st
 
 def _print_single_game_report(session, black_agent, white_agent) -> None:
     status = session.status()
-    score = dict(session.board.score)
+    score = session.board.score_by_player()
     totals = status.get("time_used_ms", {BLACK: 0, WHITE: 0})
     total_moves = len(session.move_history)
 
@@ -15,7 +15,7 @@ from ..state_space import (
     generate_legal_moves,
     print_state_space_summary,
 )
-from .board import BLACK, WHITE, Board
+from .board import BLACK, WHITE, OPPONENT, Board
 from .cli import Game
 from .config import MODE_AVA, MODE_HVA, MODE_HVH
 
@@ -33,7 +33,7 @@ def _print_state_space(state_depth_one: bool, state_player: str, state_child_ind
 
     root_player = BLACK if state_player == "black" else WHITE
     root_name = "Black" if root_player == BLACK else "White"
-    next_player = WHITE if root_player == BLACK else BLACK
+    next_player = OPPONENT[root_player]
     next_name = "Black" if next_player == BLACK else "White"
 
     print(f"=== Root Node ({root_name} to move) ===")
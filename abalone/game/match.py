@@ -164,7 +164,7 @@ def _run_game(
         "winner": status["winner"],
         "reason": status["game_over_reason"],
         "history": session.move_history,
-        "score": dict(session.board.score),
+        "score": session.board.score_by_player(),
         "black_ai_id": black_ai_id,
         "white_ai_id": white_ai_id,
     }
@@ -1,30 +1,93 @@
 """Abalone web server — serves the HTML UI and JSON API."""
 
+import gzip
 import json
 import os
-from http.server import BaseHTTPRequestHandler, HTTPServer
+import threading
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+from urllib.parse import parse_qs
 
 from .session import GameSession
 
 session = GameSession()
+# Requests are handled on separate threads; every session call goes through this lock.
+session_lock = threading.Lock()
 
 PACKAGE_DIR = os.path.dirname(os.path.dirname(__file__))
 STATIC_DIR = os.path.join(PACKAGE_DIR, "static")
 
 
+def _load_static(name: str) -> bytes:
+    """Read one packaged frontend asset."""
+    with open(os.path.join(STATIC_DIR, name), "rb") as file:
+        return file.read()
+
+
+# API payloads are plain acyclic dicts/lists; skip the cycle check and whitespace.
+_encode_json = json.JSONEncoder(separators=(",", ":"), check_circular=False).encode
+
+# Bodies at or below this size are sent uncompressed; gzip framing would outweigh the savings.
+GZIP_MIN_BYTES = 1024
+
+
+def _static_entry(name: str, mime: str):
+    """Return `(raw bytes, gzip bytes, mime)` for one packaged frontend asset."""
+    data = _load_static(name)
+    return data, gzip.compress(data), mime
+
+
+# Frontend assets never change while the server runs, so read (and compress) them once.
+STATIC_FILES = {
+    name: _static_entry(name, mime)
+    for name, mime in (
+        ("index.html", "text/html"),
+        ("style.css", "text/css"),
+        ("script.js", "application/javascript"),
+    )
+}
+STATIC_ROUTES = {
+    "/": "index.html",
+    "/index.html": "index.html",
+    "/style.css": "style.css",
+    "/script.js": "script.js",
+}
+
+
+def _query_version(params: dict, name: str):
+    """Parse one client-held version query value, or `None` when absent/invalid."""
+    values = params.get(name)
+    try:
+        return int(values[0]) if values else None
+    except ValueError:
+        return None
+
+
 class Handler(BaseHTTPRequestHandler):
     """HTTP handler for static assets and the game JSON API."""
 
+    # Keep-alive lets the polling client reuse one connection; idle sockets
+    # are dropped after `timeout` seconds so they do not pin handler threads.
+    protocol_version = "HTTP/1.1"
+    timeout = 30
+
     def do_GET(self):
         """Serve static frontend files and `/api/state`."""
-        if self.path in ("/", "/index.html"):
-            self._serve_file("index.html", "text/html")
-        elif self.path == "/style.css":
-            self._serve_file("style.css", "text/css")
-        elif self.path == "/script.js":
-            self._serve_file("script.js", "application/javascript")
-        elif self.path == "/api/state":
-            self._json_response(session.state_json())
+        path, _, query = self.path.partition("?")
+        name = STATIC_ROUTES.get(path)
+        if name is not None:
+            self._serve_file(name)
+        elif path == "/api/state":
+            params = parse_qs(query)
+            self._state_response(
+                self._with_session(
+                    session.state_json,
+                    _query_version(params, "legal_moves_version"),
+                    _query_version(params, "board_version"),
+                    params.get("epoch", [None])[0],
+                )
+            )
         else:
             self.send_error(404)
 
@@ -38,42 +101,92 @@ class Handler(BaseHTTPRequestHandler):
             return
 
         if self.path == "/api/move":
-            self._json_response(session.apply_human_move(body))
+            self._json_response(self._with_session(session.apply_human_move, body))
         elif self.path == "/api/agent-move":
-            self._json_response(session.apply_agent_move())
+            self._json_response(self._agent_move())
         elif self.path == "/api/undo":
-            self._json_response(session.undo())
+            self._json_response(self._with_session(session.undo))
         elif self.path == "/api/reset":
-            self._json_response(session.reset())
+            self._json_response(self._with_session(session.reset))
         elif self.path == "/api/pause":
-            self._json_response(session.toggle_pause())
+            self._json_response(self._with_session(session.toggle_pause))
         elif self.path == "/api/resign":
-            self._json_response(session.resign())
+            self._json_response(self._with_session(session.resign))
         elif self.path == "/api/config":
-            self._json_response(session.configure(body))
+            self._json_response(self._with_session(session.configure, body))
         else:
             self.send_error(404)
 
+    def _agent_move(self) -> dict:
+        """Run an AI turn, holding `session_lock` only around setup and apply.
+
+        The search itself runs on a snapshot board without the lock, so state
+        polls, pause, and other requests are served while the agent thinks.
+        """
+        pending = self._with_session(session.begin_agent_search)
+        if isinstance(pending, dict):
+            return pending
+        try:
+            search_result = pending.run()
+        except BaseException:
+            self._with_session(session.cancel_agent_search, pending)
+            raise
+        return self._with_session(session.finish_agent_search, pending, search_result)
+
+    @staticmethod
+    def _with_session(method, *args):
+        """Call a session method under `session_lock`; JSON encoding happens after release."""
+        with session_lock:
+            return method(*args)
+
+    def _raw_write(self, mime: str, payload: bytes, compressed: Optional[bytes] = None, extra_headers: str = ""):
+        """Send a 200 response with headers and body in a single socket write.
+
+        Bodies over `GZIP_MIN_BYTES` are gzip-encoded when the client accepts it,
+        using `compressed` when the caller already has the encoded bytes, so every
+        response carries `Vary: Accept-Encoding`.
+        """
+        self.log_request(200)
+        encoding = ""
+        if len(payload) > GZIP_MIN_BYTES and "gzip" in self.headers.get("Accept-Encoding", ""):
+            payload = compressed if compressed is not None else gzip.compress(payload, compresslevel=1)
+            encoding = "Content-Encoding: gzip\r\n"
+        head = (
+            f"{self.protocol_version} 200 OK\r\n"
+            f"Content-Type: {mime}\r\n"
+            "Vary: Accept-Encoding\r\n"
+            f"{encoding}"
+            f"{extra_headers}"
+            f"Content-Length: {len(payload)}\r\n\r\n"
+        ).encode("latin-1")
+        self.wfile.write(head + payload)
+
     def _json_response(self, data):
         """Return a JSON response payload with status 200."""
-        payload = json.dumps(data).encode()
-        self.send_response(200)
-        self.send_header("Content-Type", "application/json")
-        self.send_header("Content-Length", len(payload))
-        self.end_headers()
-        self.wfile.write(payload)
-
-    def _serve_file(self, name: str, mime: str):
-        """Serve a static file from the packaged `static/` directory."""
-        path = os.path.join(STATIC_DIR, name)
-        with open(path, "rb") as file:
-            data = file.read()
-
-        self.send_response(200)
-        self.send_header("Content-Type", mime)
-        self.send_header("Content-Length", len(data))
-        self.end_headers()
-        self.wfile.write(data)
+        self._raw_write("application/json", _encode_json(data).encode())
+
+    def _state_response(self, data):
+        """Send `/api/state` with a content ETag, answering a matching `If-None-Match` with 304.
+
+        The ETag is weak because it is computed from the JSON before `_raw_write`
+        picks an encoding, so gzip and identity bodies share it.
+        """
+        payload = _encode_json(data).encode()
+        etag = f'W/"{zlib.crc32(payload):08x}"'
+        if self.headers.get("If-None-Match") == etag:
+            self.log_request(304)
+            self.wfile.write(
+                f"{self.protocol_version} 304 Not Modified\r\n"
+                f"ETag: {etag}\r\n"
+                "Vary: Accept-Encoding\r\n\r\n".encode("latin-1")
+            )
+            return
+        self._raw_write("application/json", payload, extra_headers=f"ETag: {etag}\r\nCache-Control: no-cache\r\n")
+
+    def _serve_file(self, name: str):
+        """Serve a preloaded static file from the packaged `static/` directory."""
+        data, compressed, mime = STATIC_FILES[name]
+        self._raw_write(mime, data, compressed)
 
     def log_message(self, fmt, *args):
         """Suppress default request logs to keep terminal output clean."""
@@ -96,7 +209,7 @@ def run(port: int = 9000):
         except OSError:
             continue
 
-    server = HTTPServer(("", port), Handler)
+    server = ThreadingHTTPServer(("", port), Handler)
     url = f"http://localhost:{port}"
     print(f"Abalone running at  {url}")
     webbrowser.open(url)
@@ -1,7 +1,9 @@
 """Shared game session state used by CLI and HTTP server."""
 
+import secrets
 import time
 from collections.abc import Mapping
+from dataclasses import dataclass
 from typing import Dict, List, Optional, Set
 
 from ..ai.agent import choose_move_with_info
@@ -9,14 +11,129 @@ from ..ai.heuristics import evaluate_breakdown
 from ..ai.types import AgentConfig
 from ..players.registry import list_agent_metadata, resolve_agent_for_runtime
 from ..players.validator import validate_move, validate_payload_move
-from ..state_space import generate_legal_moves
-from .board import BLACK, WHITE, Board, EMPTY, Move, is_valid, neighbor, pos_to_str, str_to_pos
+from .board import BLACK, CELL_LABELS, WHITE, Board, Move, NEIGHBOR_TABLE, OPPONENT, POS_TO_STR, str_to_pos
 from .config import CONTROLLER_AI, CONTROLLER_HUMAN, GameConfig, merge_config
 
 
+class HistoryEntry(Mapping):
+    """One applied move in `GameSession.move_history`, readable like the dict it replaces."""
+
+    __slots__ = (
+        "move",
+        "result",
+        "moved_to",
+        "undo",
+        "signature",
+        "clock_snapshot",
+        "time_used_snapshot",
+        "player",
+        "source",
+        "search",
+        "agent_id",
+        "agent_label",
+        "duration_ms",
+    )
+    _FIELDS = frozenset(__slots__)
+
+    def __init__(
+        self,
+        move: Move,
+        result: dict,
+        moved_to: List[str],
+        undo: dict,
+        signature: tuple,
+        clock_snapshot: Dict[int, int],
+        time_used_snapshot: Dict[int, int],
+        player: int,
+        source: str,
+        search: Optional[dict],
+        agent_id: Optional[str],
+        agent_label: Optional[str],
+        duration_ms: int,
+    ):
+        """Store one history record's fields in slots."""
+        self.move = move
+        self.result = result
+        self.moved_to = moved_to
+        self.undo = undo
+        self.signature = signature
+        self.clock_snapshot = clock_snapshot
+        self.time_used_snapshot = time_used_snapshot
+        self.player = player
+        self.source = source
+        self.search = search
+        self.agent_id = agent_id
+        self.agent_label = agent_label
+        self.duration_ms = duration_ms
+
+    def __getitem__(self, key: str):
+        """Return a field by name, raising `KeyError` for unknown names."""
+        if key not in self._FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self):
+        """Iterate field names in declaration order."""
+        return iter(self.__slots__)
+
+    def __len__(self) -> int:
+        """Return the number of fields."""
+        return len(self.__slots__)
+
+    def to_dict(self) -> dict:
+        """Return the fields as a plain dict."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+@dataclass
+class PendingAgentSearch:
+    """An AI search snapshotted by `GameSession.begin_agent_search`."""
+
+    board: Board
+    player: int
+    agent: object
+    config: AgentConfig
+    pre_move: Optional[dict]
+    generation: int
+
+    def run(self):
+        """Run the search on the snapshot board and return its `SearchResult`."""
+        return choose_move_with_info(self.board, self.player, agent=self.agent, config=self.config)
+
+
 class GameSession:
     """Own the mutable game runtime state shared by CLI and HTTP layers."""
 
+    __slots__ = (
+        "initial_time_ms",
+        "_config",
+        "_turn_limit_us",
+        "opening_seed",
+        "agent_weight_overrides",
+        "agent_depth_overrides",
+        "telemetry_agent_ids",
+        "board",
+        "current_player",
+        "move_history",
+        "time_left_us",
+        "time_used_us",
+        "last_clock_update_us",
+        "turn_start_us",
+        "turn_start_epoch_ms",
+        "pause_start_us",
+        "paused",
+        "started",
+        "_resigned",
+        "_resign_winner",
+        "_history_rows",
+        "_legal_moves_key",
+        "_legal_moves_cache",
+        "legal_moves_version",
+        "board_version",
+        "state_epoch",
+        "_pending_search",
+    )
+
     def __init__(
         self,
         config: Optional[GameConfig] = None,
@@ -46,8 +163,7 @@ class GameSession:
         self.move_history: List[dict] = []
         self.time_left_us = {BLACK: self.initial_time_ms * 1000, WHITE: self.initial_time_ms * 1000}
         self.time_used_us = {BLACK: 0, WHITE: 0}
-        self.last_clock_update_us = self._now_us()
-        self.turn_start_us = self._now_us()
+        self.last_clock_update_us = self.turn_start_us = self._now_us()
         self.turn_start_epoch_ms = int(time.time() * 1000)
         self.pause_start_us: Optional[int] = None
         self.paused = False
@@ -57,10 +173,42 @@ class GameSession:
         self._resigned = False
         self._resign_winner: Optional[int] = None
 
+        # Serialized history rows as (entry, row) pairs, reused while the entry is unchanged.
+        self._history_rows: List[tuple] = []
+
+        # Serialized legal moves, rebuilt only when the position, side, or gating changes.
+        self._legal_moves_key: Optional[tuple] = None
+        self._legal_moves_cache: List[dict] = []
+        self.legal_moves_version = 0
+
+        # Bumped whenever the side to move or the position changes; lets polling
+        # clients skip unchanged cells/history and marks in-flight searches stale.
+        self.board_version = 0
+        # Random per-session token; the version counters restart at 0 in every
+        # process, so client-held versions only count when the epoch matches too.
+        self.state_epoch = secrets.token_hex(4)
+        self._pending_search: Optional[PendingAgentSearch] = None
+
         self.board.setup_standard()
 
     @property
-    def controllers(self) -> Dict[int, str]:
+    def config(self) -> GameConfig:
+        """Return the active session config."""
+        return self._config
+
+    @config.setter
+    def config(self, value: GameConfig):
+        """Install a config and precompute per-player turn limits in microseconds."""
+        self._config = value
+        # Indexed by player color; None disables the per-turn limit for that side.
+        self._turn_limit_us = (
+            None,
+            value.player1_time_per_turn_s * 1_000_000 or None,
+            value.player2_time_per_turn_s * 1_000_000 or None,
+        )
+
+    @property
+    def controllers(self) -> Mapping[int, str]:
         """Return per-player controller mapping (`human` or `ai`)."""
         return self.config.controllers()
 
@@ -118,35 +266,50 @@ class GameSession:
             "time_used_ms": self._time_used_ms(),
         }
 
+    def _is_game_over(self) -> bool:
+        """Return whether any `_status` terminal condition holds, without building a payload."""
+        if self._resigned:
+            return True
+        score = self.board.score
+        if score[BLACK] >= 6 or score[WHITE] >= 6:
+            return True
+        if self.time_left_us[BLACK] + self.time_left_us[WHITE] <= 0:
+            return True
+        max_moves = self.config.max_moves
+        return max_moves > 0 and len(self.move_history) >= max_moves
+
     def _status(self) -> dict:
         """Compute terminal status metadata without mutating session state."""
         # Check resign first
         if self._resigned:
             return self._status_payload(True, self._resign_winner, "resign")
 
-        if self.board.score[BLACK] >= 6:
+        score = self.board.score
+        if score[BLACK] >= 6:
             return self._status_payload(True, BLACK, "score")
 
-        if self.board.score[WHITE] >= 6:
+        if score[WHITE] >= 6:
             return self._status_payload(True, WHITE, "score")
 
         # Timeout: shared game time expired (sum of both clocks)
-        total_time_left = self.time_left_us[BLACK] + self.time_left_us[WHITE]
-        if total_time_left <= 0:
-            winner, winner_tiebreak = self._winner_by_score_then_time()
-            return self._status_payload(True, winner, "timeout", winner_tiebreak)
-
-        # Max moves check
-        if self.config.max_moves > 0 and len(self.move_history) >= self.config.max_moves:
-            winner, winner_tiebreak = self._winner_by_score_then_time()
-            return self._status_payload(True, winner, "max_moves", winner_tiebreak)
+        time_left = self.time_left_us
+        if time_left[BLACK] + time_left[WHITE] <= 0:
+            reason = "timeout"
+        else:
+            # Max moves check
+            max_moves = self.config.max_moves
+            if max_moves <= 0 or len(self.move_history) < max_moves:
+                return self._status_payload(False, None, None)
+            reason = "max_moves"
 
-        return self._status_payload(False, None, None)
+        winner, winner_tiebreak = self._winner_by_score_then_time()
+        return self._status_payload(True, winner, reason, winner_tiebreak)
 
-    def _tick_clock(self):
+    def _tick_clock(self, now: Optional[int] = None):
         """Update active player's remaining time based on elapsed monotonic time."""
-        now = self._now_us()
-        if not self.started or self._status()["game_over"] or self.paused:
+        if now is None:
+            now = self._now_us()
+        if not self.started or self.paused or self._is_game_over():
             self.last_clock_update_us = now
             return
 
@@ -157,39 +320,29 @@ class GameSession:
 
         self.last_clock_update_us = now
 
-    def _check_move_time_limit(self):
+    def _check_move_time_limit(self, now: Optional[int] = None):
         """If per-move time limit is exceeded, auto-switch to next player."""
-        if not self.started:
-            return
-
-        # Use per-player turn time limit
-        if self.current_player == BLACK:
-            turn_limit_s = self.config.player1_time_per_turn_s
-        else:
-            turn_limit_s = self.config.player2_time_per_turn_s
-
-        if turn_limit_s <= 0:
-            return
-        if self._status()["game_over"] or self.paused:
+        limit_us = self._turn_limit_us[self.current_player]
+        if limit_us is None or not self.started or self.paused or self._is_game_over():
             return
 
-        now = self._now_us()
-        elapsed_us = max(0, now - self.turn_start_us)
-        limit_us = turn_limit_s * 1000000
-
-        if elapsed_us >= limit_us:
+        if now is None:
+            now = self._now_us()
+        if now - self.turn_start_us >= limit_us:
             # Auto-switch turn (skip current player's move)
-            self.current_player = WHITE if self.current_player == BLACK else BLACK
+            self.current_player = OPPONENT[self.current_player]
+            self.board_version += 1
             self.last_clock_update_us = now
             self.turn_start_us = now
             self.turn_start_epoch_ms = int(time.time() * 1000)
 
     def _before_turn_action(self) -> Optional[str]:
         """Run shared pre-action checks and return an error message when blocked."""
-        self._tick_clock()
-        self._check_move_time_limit()
+        now = self._now_us()
+        self._tick_clock(now)
+        self._check_move_time_limit(now)
 
-        if self._status()["game_over"]:
+        if self._is_game_over():
             return "Game is over"
         if self.paused:
             return "Game is paused"
@@ -229,20 +382,25 @@ class GameSession:
         self._tick_clock()
         return self._status()
 
+    def is_game_over(self) -> bool:
+        """Return whether the game has ended after advancing session clocks."""
+        self._tick_clock()
+        return self._is_game_over()
+
     def _moved_positions(self, move, result: Mapping) -> List[str]:
         """Return board coordinates occupied by marbles that moved in this turn."""
         moved: Set[str] = set()
 
+        direction_index = move.direction_index
         for marble in move.marbles:
-            dest = neighbor(marble, move.direction)
-            if is_valid(dest):
-                moved.add(pos_to_str(dest))
+            dest = NEIGHBOR_TABLE[marble][direction_index]
+            if dest is not None:
+                moved.add(POS_TO_STR[dest])
 
         for pushed in result.get("pushed", []):
-            pushed_pos = str_to_pos(pushed)
-            dest = neighbor(pushed_pos, move.direction)
-            if is_valid(dest):
-                moved.add(pos_to_str(dest))
+            dest = NEIGHBOR_TABLE[str_to_pos(pushed)][direction_index]
+            if dest is not None:
+                moved.add(POS_TO_STR[dest])
 
         return sorted(moved)
 
@@ -255,42 +413,46 @@ class GameSession:
         agent_label: Optional[str] = None,
     ) -> dict:
         """Apply a validated move, record history entry, and advance the turn."""
-        self._tick_clock()
+        now = self._now_us()
+        self._tick_clock(now)
         player = self.current_player
-        snapshot = self.board.copy()
+        signature = self._board_signature(self.board)
         clock_snapshot = dict(self.time_left_us)
         time_used_snapshot = dict(self.time_used_us)
-
-        now = self._now_us()
         duration_ms = max(0, now - self.turn_start_us) // 1000
 
-        result = self.board.apply_move(move, player)
-        if agent_id and search is not None and agent_id in self.telemetry_agent_ids:
+        record_telemetry = bool(agent_id and search is not None and agent_id in self.telemetry_agent_ids)
+        if record_telemetry:
+            search.setdefault("board_token_before", self.board.to_compact_token())
+        undo_info = self.board.apply_move_undo(move, player)
+        result = self.board.move_result(undo_info)
+        if record_telemetry:
             runtime_agent = resolve_agent_for_runtime(agent_id, self.agent_weight_overrides)
-            search.setdefault("board_token_before", snapshot.to_compact_token())
             search["board_token_after"] = self.board.to_compact_token()
             post_move = self._build_agent_telemetry(runtime_agent, player)
             if post_move is not None:
                 search["post_move"] = post_move
         moved_to = self._moved_positions(move, result)
         self.move_history.append(
-            {
-                "move": move,
-                "result": result,
-                "moved_to": moved_to,
-                "snapshot": snapshot,
-                "clock_snapshot": clock_snapshot,
-                "time_used_snapshot": time_used_snapshot,
-                "player": player,
-                "source": source,
-                "search": search,
-                "agent_id": agent_id,
-                "agent_label": agent_label,
-                "duration_ms": duration_ms,
-            }
+            HistoryEntry(
+                move=move,
+                result=result,
+                moved_to=moved_to,
+                undo=undo_info,
+                signature=signature,
+                clock_snapshot=clock_snapshot,
+                time_used_snapshot=time_used_snapshot,
+                player=player,
+                source=source,
+                search=search,
+                agent_id=agent_id,
+                agent_label=agent_label,
+                duration_ms=duration_ms,
+            )
         )
 
-        self.current_player = WHITE if self.current_player == BLACK else BLACK
+        self.current_player = OPPONENT[self.current_player]
+        self.board_version += 1
         self.last_clock_update_us = now
         self.turn_start_us = now
         self.turn_start_epoch_ms = int(time.time() * 1000)
@@ -323,22 +485,18 @@ class GameSession:
 
     def _current_turn_budget_ms(self) -> Optional[int]:
         """Return remaining search budget for the active turn, including safety margin."""
-        if self.current_player == BLACK:
-            turn_limit_s = self.config.player1_time_per_turn_s
-        else:
-            turn_limit_s = self.config.player2_time_per_turn_s
-        if turn_limit_s <= 0:
+        limit_us = self._turn_limit_us[self.current_player]
+        if limit_us is None:
             return None
 
         elapsed_ms = max(0, (self._now_us() - self.turn_start_us) // 1000)
-        remaining_ms = (turn_limit_s * 1000) - elapsed_ms - 100
+        remaining_ms = (limit_us // 1000) - elapsed_ms - 100
         return max(0, remaining_ms)
 
     @staticmethod
     def _board_signature(board: Board) -> tuple:
-        """Serialize board occupancy and score for cycle detection."""
-        occupied = tuple(sorted((pos, val) for pos, val in board.cells.items() if val != EMPTY))
-        return (occupied, board.score[BLACK], board.score[WHITE])
+        """Summarize board occupancy (via its Zobrist hash) and score for cycle detection."""
+        return (board.zhash, board.score[BLACK], board.score[WHITE])
 
     def _repeat_move_to_avoid(self) -> Optional[Move]:
         """Detect repeated board states and return the last move from that state to avoid."""
@@ -351,11 +509,11 @@ class GameSession:
             entry = self.move_history[index]
             if entry.get("player") != self.current_player:
                 continue
-            snapshot = entry.get("snapshot")
+            signature = entry.get("signature")
             move = entry.get("move")
-            if snapshot is None or move is None:
+            if signature is None or move is None:
                 continue
-            if self._board_signature(snapshot) == current_sig:
+            if signature == current_sig:
                 return move
         return None
 
@@ -393,39 +551,77 @@ class GameSession:
 
     def apply_agent_move(self) -> dict:
         """Ask the minimax agent for a move and apply it on AI-controlled turns."""
+        pending = self.begin_agent_search()
+        if isinstance(pending, dict):
+            return pending
+        try:
+            search_result = pending.run()
+        except BaseException:
+            self.cancel_agent_search(pending)
+            raise
+        return self.finish_agent_search(pending, search_result)
+
+    def begin_agent_search(self):
+        """Validate an AI turn and snapshot everything its search needs.
+
+        Returns an error dict when the turn is blocked, otherwise a
+        `PendingAgentSearch` whose `run()` touches only a private board copy, so
+        callers may run it without holding the session lock.
+        """
         error = self._before_turn_action()
         if error:
             return {"error": error}
 
         if self.current_controller != CONTROLLER_AI:
             return {"error": "It is a human-controlled turn."}
+        if self._pending_search is not None:
+            return {"error": "Agent search already in progress"}
 
         agent_id = self.ai_id_for_player(self.current_player)
         agent = resolve_agent_for_runtime(agent_id, self.agent_weight_overrides)
         requested_depth = self._resolve_ai_depth(self.current_player, agent)
-        time_budget_ms = self._current_turn_budget_ms()
-        avoid_move = self._repeat_move_to_avoid()
-        pre_move = self._build_agent_telemetry(agent, self.current_player)
         board_token_before = self.board.to_compact_token() if agent.id in self.telemetry_agent_ids else None
-        search_result = choose_move_with_info(
-            self.board,
-            self.current_player,
+        pending = PendingAgentSearch(
+            board=self.board.copy(),
+            player=self.current_player,
             agent=agent,
             config=AgentConfig(
                 depth=requested_depth,
-                time_budget_ms=time_budget_ms,
+                time_budget_ms=self._current_turn_budget_ms(),
                 opening_seed=self.opening_seed,
                 is_opening_turn=(self.current_player == BLACK and not self.move_history),
-                avoid_move=avoid_move,
+                avoid_move=self._repeat_move_to_avoid(),
                 board_token_before=board_token_before,
                 remaining_game_moves=self._remaining_game_moves(),
             ),
+            pre_move=self._build_agent_telemetry(agent, self.current_player),
+            generation=self.board_version,
         )
+        self._pending_search = pending
+        return pending
+
+    def cancel_agent_search(self, pending: PendingAgentSearch):
+        """Release the in-progress marker for a search that will not be finished."""
+        if self._pending_search is pending:
+            self._pending_search = None
+
+    def finish_agent_search(self, pending: PendingAgentSearch, search_result) -> dict:
+        """Apply a finished search's move unless the position or turn gating changed while it ran."""
+        self.cancel_agent_search(pending)
+        if pending.generation != self.board_version:
+            return {"error": "Position changed during agent search"}
+        # Pause, resign, and config changes leave the position alone but can still block the move.
+        error = self._before_turn_action()
+        if error:
+            return {"error": error}
+        if self.current_controller != CONTROLLER_AI:
+            return {"error": "It is a human-controlled turn."}
+
         search_payload = search_result.as_dict()
-        if pre_move is not None:
-            search_payload["pre_move"] = pre_move
-        if board_token_before is not None:
-            search_payload["board_token_before"] = board_token_before
+        if pending.pre_move is not None:
+            search_payload["pre_move"] = pending.pre_move
+        if pending.config.board_token_before is not None:
+            search_payload["board_token_before"] = pending.config.board_token_before
 
         move = search_result.move
         ok, error = validate_move(self.board, self.current_player, move)
@@ -436,18 +632,19 @@ class GameSession:
             move,
             source=CONTROLLER_AI,
             search=search_payload,
-            agent_id=agent.id,
-            agent_label=agent.label,
+            agent_id=pending.agent.id,
+            agent_label=pending.agent.label,
         )
 
     def undo(self) -> dict:
-        """Revert the last move, including board and clock snapshots."""
+        """Revert the last move from its undo token and restore clock snapshots."""
         if not self.move_history:
             return {"error": "Nothing to undo"}
 
         entry = self.move_history.pop()
-        self.board = entry["snapshot"]
+        self.board.undo_move(entry["undo"])
         self.current_player = entry["player"]
+        self.board_version += 1
         self.time_left_us = dict(entry["clock_snapshot"])
         self.time_used_us = dict(entry.get("time_used_snapshot", {BLACK: 0, WHITE: 0}))
         now = self._now_us()
@@ -461,6 +658,7 @@ class GameSession:
         self.board = Board()
         self.board.setup_layout(self.config.board_layout)
         self.current_player = BLACK
+        self.board_version += 1
         self.move_history = []
 
         # Use shared game time from config, fallback to initial_time_ms
@@ -483,17 +681,17 @@ class GameSession:
 
     def resign(self, payload: Optional[Mapping] = None) -> dict:
         """Current player resigns. Opponent wins."""
-        if self._status()["game_over"]:
+        if self._is_game_over():
             return {"error": "Game is already over"}
 
         self._resigned = True
-        self._resign_winner = WHITE if self.current_player == BLACK else BLACK
+        self._resign_winner = OPPONENT[self.current_player]
         return {"ok": True, "winner": self._resign_winner}
 
     def toggle_pause(self) -> dict:
         """Toggle pause state while preserving accurate per-turn timing."""
-        self._tick_clock()
         now = self._now_us()
+        self._tick_clock(now)
         if not self.paused:
             # Pausing: record when we paused
             self.paused = True
@@ -508,43 +706,85 @@ class GameSession:
         self.last_clock_update_us = now
         return {"ok": True, "paused": self.paused}
 
-    def state_json(self) -> dict:
-        """Serialize full session state for the web client API contract."""
-        self._tick_clock()
-        self._check_move_time_limit()
-        status = self._status()
-
-        cells = {}
-        for pos, val in self.board.cells.items():
-            cells[pos_to_str(pos)] = val
+    def _legal_moves_payload(self, include: bool) -> List[dict]:
+        """Return the serialized legal-move list, bumping `legal_moves_version` when it changes."""
+        key = (self.board.zhash, self.current_player, include)
+        if key == self._legal_moves_key:
+            return self._legal_moves_cache
 
         legal_list = []
-        if not status["game_over"] and self.current_controller == CONTROLLER_HUMAN and not self.paused:
-            for move in generate_legal_moves(self.board, self.current_player):
-                dr, dc = move.direction
-                legal_list.append(
-                    {
-                        "marbles": [pos_to_str(p) for p in move.marbles],
-                        "direction": [dr, dc],
-                        "notation": move.to_notation(),
-                        "is_inline": move.is_inline,
-                    }
-                )
-
-        history = []
-        for entry in self.move_history:
-            history.append(
+        if include:
+            from ..state_space import generate_legal_moves
+
+            legal_list = [
                 {
-                    "notation": entry["move"].to_notation(pushed=bool(entry["result"]["pushed"])),
-                    "player": entry["player"],
-                    "pushoff": entry["result"]["pushoff"],
-                    "source": entry["source"],
-                    "search": entry["search"],
-                    "agent_id": entry.get("agent_id"),
-                    "agent_label": entry.get("agent_label"),
-                    "duration_ms": entry.get("duration_ms", 0),
+                    "marbles": [POS_TO_STR[p] for p in move.marbles],
+                    "direction": list(move.direction),
+                    "notation": move.to_notation(),
+                    "is_inline": move.is_inline,
                 }
-            )
+                for move in generate_legal_moves(self.board, self.current_player)
+            ]
+        self._legal_moves_key = key
+        self._legal_moves_cache = legal_list
+        self.legal_moves_version += 1
+        return legal_list
+
+    def _history_payload(self) -> List[dict]:
+        """Serialize move history, reusing rows for entries already serialized."""
+        cached = self._history_rows
+        rows = []
+        for index, entry in enumerate(self.move_history):
+            if index < len(cached) and cached[index][0] is entry:
+                rows.append(cached[index][1])
+                continue
+            del cached[index:]
+            row = {
+                "notation": entry["move"].to_notation(pushed=bool(entry["result"]["pushed"])),
+                "player": entry["player"],
+                "pushoff": entry["result"]["pushoff"],
+                "source": entry["source"],
+                "search": entry["search"],
+                "agent_id": entry.get("agent_id"),
+                "agent_label": entry.get("agent_label"),
+                "duration_ms": entry.get("duration_ms", 0),
+            }
+            cached.append((entry, row))
+            rows.append(row)
+        del cached[len(rows):]
+        return rows
+
+    def state_json(
+        self,
+        legal_moves_version: Optional[int] = None,
+        board_version: Optional[int] = None,
+        epoch: Optional[str] = None,
+    ) -> dict:
+        """Serialize full session state for the web client API contract.
+
+        When `epoch` and `legal_moves_version` both match the current session, `legal_moves`
+        is sent as `None` so polling clients can keep the list they already hold.
+        Likewise a matching `epoch` and `board_version` sends `cells` and `history` as `None`.
+        """
+        if epoch != self.state_epoch:
+            legal_moves_version = board_version = None
+        now = self._now_us()
+        self._tick_clock(now)
+        self._check_move_time_limit(now)
+        status = self._status()
+
+        board_unchanged = board_version == self.board_version
+        cells = None if board_unchanged else dict(zip(CELL_LABELS, self.board.cell_bytes()))
+
+        legal_list = self._legal_moves_payload(
+            not status["game_over"] and self.current_controller == CONTROLLER_HUMAN and not self.paused
+        )
+        if legal_moves_version == self.legal_moves_version:
+            legal_list = None
+        else:
+            legal_list = list(legal_list)
+
+        history = None if board_unchanged else self._history_payload()
 
         last_move_marbles = []
         last_move_direction = []
@@ -572,13 +812,16 @@ class GameSession:
             "player1_time_per_turn_s": self.config.player1_time_per_turn_s,
             "player2_time_per_turn_s": self.config.player2_time_per_turn_s,
             "available_agents": list_agent_metadata(),
-            "score": self.board.score,
+            "score": self.board.score_by_player(),
             "game_over": status["game_over"],
             "winner": status["winner"],
             "game_over_reason": status["game_over_reason"],
             "winner_tiebreak": status["winner_tiebreak"],
             "legal_moves": legal_list,
+            "legal_moves_version": self.legal_moves_version,
             "history": history,
+            "board_version": self.board_version,
+            "state_epoch": self.state_epoch,
             "last_move_marbles": last_move_marbles,
             "last_move_direction": last_move_direction,
             "marble_counts": {
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Iterable, Optional
 
 try:
@@ -40,10 +41,11 @@ def preflight_or_exit(build_command: Optional[str] = None) -> None:
     raise SystemExit(missing_extension_message(build_command))
 
 
+@lru_cache(maxsize=None)
 def _board_api():
+    """Return board constants, imported lazily once to avoid an import cycle."""
     from .game.board import (
         BLACK,
-        DIRECTION_INDEX,
         DIRECTIONS,
         Move,
         ORDERED_VALID_POSITIONS,
@@ -53,7 +55,6 @@ def _board_api():
 
     return {
         "BLACK": BLACK,
-        "DIRECTION_INDEX": DIRECTION_INDEX,
         "DIRECTIONS": DIRECTIONS,
         "Move": Move,
         "ORDERED_VALID_POSITIONS": ORDERED_VALID_POSITIONS,
@@ -63,9 +64,7 @@ def _board_api():
 
 
 def _encode_board_cells(board) -> bytes:
-    api = _board_api()
-    ordered_valid_positions = api["ORDERED_VALID_POSITIONS"]
-    return bytes(int(board.cells[pos]) for pos in ordered_valid_positions)
+    return board.cell_bytes()
 
 
 def _decode_move(payload) -> Optional[object]:
@@ -73,11 +72,7 @@ def _decode_move(payload) -> Optional[object]:
     if payload is None:
         return None
     marble_indexes, direction_index = payload
-    ordered_valid_positions = api["ORDERED_VALID_POSITIONS"]
-    move_type = api["Move"]
-    directions = api["DIRECTIONS"]
-    marbles = tuple(ordered_valid_positions[int(index)] for index in marble_indexes)
-    return move_type.from_canonical(marbles, directions[int(direction_index)])
+    return api["Move"].from_canonical_ids(tuple(marble_indexes), int(direction_index))
 
 
 def _encode_move(move: Optional[object]):
@@ -85,20 +80,33 @@ def _encode_move(move: Optional[object]):
     if move is None:
         return None
     position_index = api["POSITION_INDEX"]
-    direction_index = api["DIRECTION_INDEX"]
     marble_indexes = tuple(position_index[pos] for pos in move.marbles)
-    return marble_indexes, direction_index[move.direction]
+    return marble_indexes, move.direction_index
 
 
 def generate_legal_moves(board, player: int):
     """Return native-generated legal moves."""
     native_ext = require_available()
+    from_canonical_ids = _board_api()["Move"].from_canonical_ids
     return [
-        _decode_move(payload)
-        for payload in native_ext.generate_legal_moves(_encode_board_cells(board), int(player))
+        from_canonical_ids(marble_indexes, direction_index)
+        for marble_indexes, direction_index in native_ext.generate_legal_moves(
+            _encode_board_cells(board), int(player)
+        )
     ]
 
 
+def is_legal_move(board, player: int, move) -> bool:
+    """Return native full legality (ownership, formation, and push rules) for one move."""
+    native_ext = require_available()
+    api = _board_api()
+    position_index = api["POSITION_INDEX"]
+    if move.direction_index < 0 or any(pos not in position_index for pos in move.marbles):
+        return False
+    marble_indexes = tuple(position_index[pos] for pos in move.marbles)
+    return native_ext.is_legal_move(_encode_board_cells(board), int(player), (marble_indexes, move.direction_index))
+
+
 def evaluate_weighted(board, player: int, ordered_weights: Iterable[float]):
     """Return a native weighted evaluation."""
     native_ext = require_available()
@@ -9,7 +9,7 @@ File-level I/O helpers live in :mod:`abalone.file_handler`.
 """
 
 from dataclasses import dataclass
-from typing import List, Optional, Set, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 
 from .game.board import (
     BLACK,
@@ -18,7 +18,6 @@ from .game.board import (
     Move,
     Position,
     is_valid,
-    neighbor,
     pos_to_str,
     str_to_pos,
 )
@@ -27,6 +26,21 @@ INITIAL_MARBLES_PER_PLAYER = 14
 
 _NATIVE_GENERATE_LEGAL_MOVES = None
 
+# Legal moves depend only on occupancy, so they are memoized by (Zobrist hash, player).
+_LEGAL_MOVE_CACHE_SIZE = 4096
+_LEGAL_MOVE_CACHE: Dict[Tuple[int, int], Tuple[Move, ...]] = {}
+
+# Display category per (marble count, inline); single-marble moves are always "inline".
+_MOVE_CATEGORY: Dict[Tuple[int, bool], str] = {
+    (1, True): "single_inline",
+    (1, False): "single_inline",
+    (2, True): "double_inline",
+    (2, False): "double_broadside",
+    (3, True): "triple_inline",
+    (3, False): "triple_broadside",
+}
+_MOVE_CATEGORY_NAMES: Tuple[str, ...] = tuple(dict.fromkeys(_MOVE_CATEGORY.values()))
+
 
 def _get_native_generate_legal_moves():
     global _NATIVE_GENERATE_LEGAL_MOVES
@@ -54,8 +68,15 @@ class PositionListComparison:
 
 
 def generate_legal_moves(board: Board, player: int) -> List[Move]:
-    """Generate legal moves through the compiled native engine."""
-    return _get_native_generate_legal_moves()(board, player)
+    """Generate legal moves through the compiled native engine, reusing cached positions."""
+    key = (board.zhash, player)
+    cached = _LEGAL_MOVE_CACHE.get(key)
+    if cached is None:
+        cached = tuple(_get_native_generate_legal_moves()(board, player))
+        if len(_LEGAL_MOVE_CACHE) >= _LEGAL_MOVE_CACHE_SIZE:
+            _LEGAL_MOVE_CACHE.clear()
+        _LEGAL_MOVE_CACHE[key] = cached
+    return list(cached)
 
 
 def generate_next_states(board: Board, player: int) -> List[Board]:
@@ -120,10 +141,8 @@ def load_position_list_state(text: str) -> Tuple[Board, int]:
     if black_count > INITIAL_MARBLES_PER_PLAYER or white_count > INITIAL_MARBLES_PER_PLAYER:
         raise ValueError("Input contains more than 14 marbles for one side.")
 
-    board.score = {
-        BLACK: INITIAL_MARBLES_PER_PLAYER - white_count,
-        WHITE: INITIAL_MARBLES_PER_PLAYER - black_count,
-    }
+    board.score[BLACK] = INITIAL_MARBLES_PER_PLAYER - white_count
+    board.score[WHITE] = INITIAL_MARBLES_PER_PLAYER - black_count
     board.recompute_zhash()
     player = BLACK if turn == "b" else WHITE
     return board, player
@@ -131,8 +150,8 @@ def load_position_list_state(text: str) -> Tuple[Board, int]:
 
 def dump_position_list_state(board: Board) -> str:
     """Serialize the board into the compact comma-separated `C5b`/`H9w` format."""
-    tokens = [f"{pos_to_str(pos).upper()}b" for pos in sorted(board.get_marbles(BLACK))]
-    tokens.extend(f"{pos_to_str(pos).upper()}w" for pos in sorted(board.get_marbles(WHITE)))
+    tokens = [f"{pos_to_str(pos).upper()}b" for pos in board.get_marbles(BLACK)]
+    tokens.extend(f"{pos_to_str(pos).upper()}w" for pos in board.get_marbles(WHITE))
     return ",".join(tokens)
 
 
@@ -146,17 +165,10 @@ def generate_move_notation_strings(board: Board, player: int) -> List[str]:
 
     Sumito (push) moves are marked with a trailing ``*`` via ``to_notation(pushed=True)``.
     """
-    opponent = WHITE if player == BLACK else BLACK
-    notations: List[str] = []
-    for move in generate_legal_moves(board, player):
-        pushed = False
-        if move.is_inline and move.count > 1:
-            _, leading = move.leading_trailing()
-            ahead = neighbor(leading, move.direction)
-            if is_valid(ahead) and board.cells.get(ahead) == opponent:
-                pushed = True
-        notations.append(move.to_notation(pushed=pushed))
-    return notations
+    return [
+        move.to_notation(pushed=board.would_push(move, player))
+        for move in generate_legal_moves(board, player)
+    ]
 
 
 def expand_position_list_text(text: str) -> List[str]:
@@ -242,24 +254,9 @@ def categorize_moves(moves: List[Move]) -> dict:
     :param moves: List of Move objects to categorize.
     :return: Dict mapping category names to lists of moves.
     """
-    categories = {
-        "single_inline": [],
-        "double_inline": [],
-        "double_broadside": [],
-        "triple_inline": [],
-        "triple_broadside": [],
-    }
-
+    categories: Dict[str, List[Move]] = {name: [] for name in _MOVE_CATEGORY_NAMES}
     for move in moves:
-        count = move.count
-        inline = move.is_inline
-        if count == 1:
-            categories["single_inline"].append(move)
-        elif count == 2:
-            categories["double_inline" if inline else "double_broadside"].append(move)
-        else:
-            categories["triple_inline" if inline else "triple_broadside"].append(move)
-
+        categories[_MOVE_CATEGORY[move.count, move.is_inline]].append(move)
     return categories
 
 
@@ -284,15 +281,7 @@ def print_state_space_summary(board: Board, player: int):
         print(f"    {label:25s}: {len(cat_moves)}")
 
     # Show push moves
-    push_moves = []
-    for move in legal_moves:
-        if move.is_inline and move.count > 1:
-            direction = move.direction
-            _, leading = move.leading_trailing()
-            ahead = neighbor(leading, direction)
-            opponent = WHITE if player == BLACK else BLACK
-            if is_valid(ahead) and board.cells.get(ahead) == opponent:
-                push_moves.append(move)
+    push_moves = [move for move in legal_moves if board.would_push(move, player)]
 
     if push_moves:
         print(f"\n  Push moves (sumito): {len(push_moves)}")
@@ -66,7 +66,17 @@ async function fetchState(force = false) {
     if (fetchInFlight && !force) return;
     fetchInFlight = true;
     try {
-        state = await (await fetch('/api/state')).json();
+        const previous = state;
+        const query = previous
+            ? `?legal_moves_version=${previous.legal_moves_version}&board_version=${previous.board_version}`
+                + `&epoch=${previous.state_epoch}`
+            : '';
+        const next = await (await fetch('/api/state' + query)).json();
+        // Null fields mean the server's copy matches the one we already hold.
+        if (next.legal_moves === null) next.legal_moves = previous.legal_moves;
+        if (next.cells === null) next.cells = previous.cells;
+        if (next.history === null) next.history = previous.history;
+        state = next;
         stateFetchedAt = Date.now();
         render();
         if (isConfigModalOpen()) hydrateConfigModalFromState();
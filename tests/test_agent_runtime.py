@@ -878,10 +878,10 @@ class AgentRuntimeTests(unittest.TestCase):
         )
         move_a = baseline.move
         move_b = white_moves[0]
-        snapshot = board.copy()
+        signature = GameSession._board_signature(board)
         session.move_history = [
-            {"move": move_a, "player": BLACK, "snapshot": snapshot},
-            {"move": move_b, "player": WHITE, "snapshot": board.copy()},
+            {"move": move_a, "player": BLACK, "signature": signature},
+            {"move": move_b, "player": WHITE, "signature": signature},
         ]
 
         result = session.apply_agent_move()
@@ -912,12 +912,12 @@ class AgentRuntimeTests(unittest.TestCase):
         move_b1 = white_moves[0]
         move_b2 = white_moves[1]
 
-        snapshot = board.copy()
+        signature = GameSession._board_signature(board)
         session.move_history = [
-            {"move": move_a1, "player": BLACK, "snapshot": snapshot},
-            {"move": move_b1, "player": WHITE, "snapshot": board.copy()},
-            {"move": move_a2, "player": BLACK, "snapshot": board.copy()},
-            {"move": move_b2, "player": WHITE, "snapshot": board.copy()},
+            {"move": move_a1, "player": BLACK, "signature": signature},
+            {"move": move_b1, "player": WHITE, "signature": signature},
+            {"move": move_a2, "player": BLACK, "signature": signature},
+            {"move": move_b2, "player": WHITE, "signature": signature},
         ]
 
         result = session.apply_agent_move()
@@ -0,0 +1,31 @@
+import unittest
+
+from abalone.game.board import Move
+from abalone.game.cli import Game
+
+
+class CliMoveParsingTests(unittest.TestCase):
+    """Regression checks for terminal move notation parsing."""
+
+    def test_cli_parses_inline_and_broadside_notation(self):
+        game = Game()
+        inline = Move(marbles=((0, 1), (1, 2), (2, 3)), direction=(1, 1))
+        broadside = Move(marbles=((1, 1), (2, 1)), direction=(0, 1))
+
+        self.assertEqual(game._parse_move(inline.to_notation()), inline)
+        self.assertEqual(game._parse_move(broadside.to_notation().lower()), broadside)
+        self.assertIsNone(game._parse_move("2:b1-b1>e"))
+        self.assertIsNone(game._parse_move("3:a1"))
+
+    def test_cli_parses_printed_push_marker(self):
+        game = Game()
+        inline = Move(marbles=((0, 1), (1, 2), (2, 3)), direction=(1, 1))
+        push = Move(marbles=((2, 3), (3, 4)), direction=(1, 1))
+
+        self.assertEqual(game._parse_move(inline.to_notation(pushed=True)), inline)
+        self.assertEqual(game._parse_move("2:c3e5*"), push)
+        self.assertIsNone(game._parse_move("2:b1-c1>E*"))
+
+
+if __name__ == "__main__":
+    unittest.main()
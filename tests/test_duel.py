@@ -44,7 +44,7 @@ class _BrokenExecutor(_FakeExecutor):
 class DuelTests(unittest.TestCase):
     def test_single_game_report_mentions_total_time_tiebreak(self):
         session = mock.Mock()
-        session.board.score = {duel.BLACK: 2, duel.WHITE: 2}
+        session.board.score_by_player.return_value = {duel.BLACK: 2, duel.WHITE: 2}
         session.move_history = [{}, {}]
         session.status.return_value = {
             "winner": duel.BLACK,
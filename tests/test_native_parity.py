@@ -4,7 +4,7 @@ from abalone import native
 from abalone.ai.heuristics import DEFAULT_WEIGHTS, evaluate_with_weights
 from abalone.ai.minimax import search_best_move
 from abalone.ai.types import AgentConfig
-from abalone.game.board import BLACK, WHITE, Board
+from abalone.game.board import BLACK, WHITE, Board, Move
 from abalone.players.registry import get_agent
 from abalone.state_space import generate_legal_moves
 
@@ -143,6 +143,24 @@ class NativeRegressionTests(unittest.TestCase):
             self.assertEqual(actual.decision_source, expected["decision_source"])
             self.assertAlmostEqual(actual.score, expected["score"])
 
+    def test_native_legality_matches_board_rules(self):
+        board = Board()
+        board.setup_standard()
+        candidates = [
+            Move(marbles=((0, 1), (1, 2), (2, 3)), direction=(1, 1)),
+            Move(marbles=((2, 3), (2, 4)), direction=(1, 0)),
+            Move(marbles=((0, 1), (0, 3)), direction=(1, 0)),
+            Move(marbles=((6, 5),), direction=(-1, 0)),
+            Move(marbles=((1, 1),), direction=(1, 0)),
+            Move(marbles=((8, 9),), direction=(0, 1)),
+        ]
+        for move in candidates + generate_legal_moves(board, BLACK):
+            self.assertEqual(
+                native.is_legal_move(board, BLACK, move),
+                board.is_legal_move(move, BLACK),
+                msg=move.to_notation(),
+            )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -3,7 +3,7 @@ import unittest
 from abalone import native
 from abalone.ai.agent import choose_move
 from abalone.ai.types import AgentConfig
-from abalone.game.board import BLACK, Board, Move
+from abalone.game.board import BLACK, DIRECTIONS, WHITE, Board, Move
 
 if not native.is_available():
     raise unittest.SkipTest("native extension not built")
@@ -44,6 +44,12 @@ class MinimaxPlayerTests(unittest.TestCase):
         self.assertEqual(inline.to_notation(pushed=True), "3:a1d4*")
         self.assertEqual(broadside.to_notation(), "2:b1-c1>E")
 
+    def test_move_exposes_direction_index(self):
+        move = Move(marbles=((4, 4), (4, 5)), direction=(1, 0))
+
+        self.assertEqual(DIRECTIONS[move.direction_index], move.direction)
+        self.assertEqual(Move(marbles=((4, 4),), direction=(2, 0)).direction_index, -1)
+
     def test_external_invalid_move_still_fails_full_validation(self):
         board = Board()
         board.setup_standard()
@@ -51,6 +57,66 @@ class MinimaxPlayerTests(unittest.TestCase):
 
         self.assertFalse(board.is_legal_move(move, BLACK))
 
+    def test_cells_view_reads_and_writes_through_cell_ids(self):
+        board = Board()
+        board.setup_standard()
+        board.cells[(4, 5)] = BLACK
+
+        self.assertEqual(board.get((4, 5)), BLACK)
+        self.assertIsNone(board.get((9, 9)))
+        self.assertEqual(board.marble_count(BLACK), 15)
+        self.assertEqual(len(board.cell_bytes()), 61)
+
+    def test_cell_writes_keep_zobrist_hash_incremental(self):
+        board = Board()
+        board.setup_standard()
+        board.cells[(4, 5)] = BLACK
+        incremental = board.zhash
+
+        board.recompute_zhash()
+        self.assertEqual(board.zhash, incremental)
+
+    def test_move_score_ranks_push_offs_above_pushes(self):
+        board = Board()
+        board.clear()
+        for pos in ((4, 2), (4, 3), (4, 7), (4, 8)):
+            board.cells[pos] = BLACK
+        for pos in ((4, 4), (4, 9)):
+            board.cells[pos] = WHITE
+
+        push = Move(marbles=((4, 2), (4, 3)), direction=(0, 1))
+        push_off = Move(marbles=((4, 7), (4, 8)), direction=(0, 1))
+        quiet = Move(marbles=((4, 7), (4, 8)), direction=(0, -1))
+
+        self.assertEqual(board.move_score(push_off, BLACK), 1000)
+        self.assertEqual(board.move_score(push, BLACK), 100)
+        self.assertEqual(board.move_score(quiet, BLACK), 0)
+
+    def test_apply_move_undo_restores_cells_score_and_hash(self):
+        board = Board()
+        board.setup_standard()
+        before = (board.cell_bytes(), list(board.score), board.zhash)
+        move = Move(marbles=((0, 1), (1, 2), (2, 3)), direction=(1, 1))
+
+        undo = board.apply_move_undo(move, BLACK)
+        self.assertNotEqual(board.cell_bytes(), before[0])
+        board.undo_move(undo)
+
+        self.assertEqual((board.cell_bytes(), list(board.score), board.zhash), before)
+
+    def test_display_cache_tracks_cells_and_score(self):
+        board = Board()
+        board.setup_standard()
+        first = board.display()
+        self.assertIs(board.display(), first)
+
+        board.cells[(4, 5)] = BLACK
+        moved = board.display()
+        self.assertNotEqual(moved, first)
+
+        board.score[BLACK] = 1
+        self.assertIn("Black(@@) 1 - 0", board.display())
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,7 +1,7 @@
 import unittest
 
 from abalone import native
-from abalone.game.config import GameConfig, MODE_HVA
+from abalone.game.config import GameConfig, MODE_AVA, MODE_HVA
 from abalone.game.session import GameSession
 
 if not native.is_available():
@@ -30,6 +30,119 @@ class SessionModeTests(unittest.TestCase):
         self.assertTrue(ai_result.get("ok"))
         self.assertEqual(ai_result.get("source"), "ai")
 
+    def test_undo_rolls_board_back_in_place(self):
+        session = GameSession(config=GameConfig(mode="hvh"))
+        board = session.board
+        before = board.to_compact_token()
+
+        result = session.apply_human_move(session.state_json()["legal_moves"][0])
+        self.assertTrue(result.get("ok"))
+        self.assertNotEqual(board.to_compact_token(), before)
+
+        self.assertTrue(session.undo().get("ok"))
+        self.assertIs(session.board, board)
+        self.assertEqual(board.to_compact_token(), before)
+
+    def test_game_over_check_matches_status_payload(self):
+        session = GameSession(config=GameConfig(mode="hvh", max_moves=1))
+        self.assertFalse(session._is_game_over())
+        self.assertFalse(session._status()["game_over"])
+
+        session.board.score[1] = 6
+        self.assertTrue(session._is_game_over())
+        self.assertTrue(session._status()["game_over"])
+
+        session.board.score[1] = 0
+        session.apply_human_move(session.state_json()["legal_moves"][0])
+        self.assertTrue(session._is_game_over())
+        self.assertEqual(session._status()["game_over_reason"], "max_moves")
+
+    def test_state_json_omits_unchanged_legal_moves(self):
+        session = GameSession(config=GameConfig(mode="hvh"))
+        first = session.state_json()
+        self.assertTrue(first["legal_moves"])
+
+        again = session.state_json(legal_moves_version=first["legal_moves_version"], epoch=first["state_epoch"])
+        self.assertIsNone(again["legal_moves"])
+        self.assertEqual(again["legal_moves_version"], first["legal_moves_version"])
+
+        session.apply_human_move(first["legal_moves"][0])
+        moved = session.state_json(legal_moves_version=first["legal_moves_version"], epoch=first["state_epoch"])
+        self.assertTrue(moved["legal_moves"])
+        self.assertNotEqual(moved["legal_moves_version"], first["legal_moves_version"])
+
+    def test_state_json_omits_unchanged_cells_and_history(self):
+        session = GameSession(config=GameConfig(mode="hvh"))
+        first = session.state_json()
+        self.assertIsNotNone(first["cells"])
+
+        again = session.state_json(board_version=first["board_version"], epoch=first["state_epoch"])
+        self.assertIsNone(again["cells"])
+        self.assertIsNone(again["history"])
+
+        session.apply_human_move(first["legal_moves"][0])
+        moved = session.state_json(board_version=first["board_version"], epoch=first["state_epoch"])
+        self.assertNotEqual(moved["cells"], first["cells"])
+        self.assertEqual(len(moved["history"]), 1)
+
+    def test_state_json_ignores_versions_from_another_session(self):
+        stale = GameSession(config=GameConfig(mode="hvh")).state_json()
+        session = GameSession(config=GameConfig(mode="hvh"))
+
+        fresh = session.state_json(
+            legal_moves_version=stale["legal_moves_version"],
+            board_version=stale["board_version"],
+            epoch=stale["state_epoch"],
+        )
+        self.assertNotEqual(fresh["state_epoch"], stale["state_epoch"])
+        self.assertIsNotNone(fresh["cells"])
+        self.assertIsNotNone(fresh["history"])
+        self.assertTrue(fresh["legal_moves"])
+
+    def test_agent_search_runs_on_snapshot_and_rejects_stale_results(self):
+        session = GameSession(config=GameConfig(mode=MODE_AVA, ai_depth=1, black_ai_id="kyle", white_ai_id="jonah"))
+        pending = session.begin_agent_search()
+        self.assertIsNot(pending.board, session.board)
+        self.assertIn("already in progress", session.begin_agent_search().get("error", ""))
+
+        result = pending.run()
+        session.reset()
+        stale = session.finish_agent_search(pending, result)
+        self.assertIn("Position changed", stale.get("error", ""))
+        self.assertFalse(session.move_history)
+
+        pending = session.begin_agent_search()
+        self.assertTrue(session.finish_agent_search(pending, pending.run()).get("ok"))
+        self.assertEqual(len(session.move_history), 1)
+
+    def test_agent_search_result_is_dropped_after_pause(self):
+        session = GameSession(config=GameConfig(mode=MODE_AVA, ai_depth=1, black_ai_id="kyle", white_ai_id="jonah"))
+        pending = session.begin_agent_search()
+        result = pending.run()
+        session.toggle_pause()
+
+        self.assertIn("paused", session.finish_agent_search(pending, result).get("error", ""))
+        self.assertFalse(session.move_history)
+
+    def test_agent_search_result_is_dropped_after_resign(self):
+        session = GameSession(config=GameConfig(mode=MODE_AVA, ai_depth=1, black_ai_id="kyle", white_ai_id="jonah"))
+        pending = session.begin_agent_search()
+        result = pending.run()
+        session.resign()
+
+        self.assertIn("over", session.finish_agent_search(pending, result).get("error", ""))
+        self.assertFalse(session.move_history)
+
+    def test_agent_search_result_is_dropped_after_mode_change(self):
+        session = GameSession(config=GameConfig(mode=MODE_AVA, ai_depth=1, black_ai_id="kyle", white_ai_id="jonah"))
+        pending = session.begin_agent_search()
+        result = pending.run()
+        session.configure({"mode": "hvh"})
+
+        self.assertIn("human-controlled", session.finish_agent_search(pending, result).get("error", ""))
+        self.assertFalse(session.move_history)
+        self.assertIsNone(session._pending_search)
+
 
 if __name__ == "__main__":
     unittest.main()
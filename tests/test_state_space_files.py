@@ -246,6 +246,20 @@ class StateSpaceFileTests(unittest.TestCase):
                 self.assertTrue(board.is_generated_move_legal(move, player))
                 self.assertTrue(board.is_legal_move(move, player))
 
+    def test_cached_legal_moves_follow_board_changes(self):
+        board = Board()
+        board.setup_standard()
+
+        first = generate_legal_moves(board, BLACK)
+        first.clear()
+        second = generate_legal_moves(board, BLACK)
+        self.assertTrue(second)
+
+        board.apply_move(second[0], BLACK)
+        after = generate_legal_moves(board, BLACK)
+        self.assertNotEqual([move.to_notation() for move in after], [move.to_notation() for move in second])
+        self.assertTrue(all(board.is_legal_move(move, BLACK) for move in after))
+
     def test_state_space_fixture_files_preserve_exact_move_and_state_order(self):
         fixture_root = Path("abalone")
         for input_path in sorted((fixture_root / "state_space_inputs").glob("Test*.input")):